@@ -34,6 +34,10 @@ GENERATE_DASHBOARD_INTERVAL = int(os.getenv('GENERATE_DASHBOARD_INTERVAL', 5))
 DATA_DIR = os.getenv('DATA_DIR', 'simulation_data')
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Output verbosity: 'info' prints everything, 'warning' hides routine
+# info and price lines (errors, warnings and trades are always shown)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'info').lower()
+
 # Create a sample .env file if it doesn't exist
 def create_sample_env_file():
     """Create a sample .env file if one doesn't exist"""
@@ -61,6 +65,9 @@ GENERATE_DASHBOARD_INTERVAL=5
 
 # Directory Settings
 DATA_DIR=simulation_data
+
+# Output (info, or warning to hide routine market and position lines)
+LOG_LEVEL=info
 """)
         print("Created sample .env file. Please edit it with your configuration.")
 
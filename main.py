@@ -8,10 +8,9 @@ import argparse
 import config
 from trading.bot import CryptoTradingBot
 from trading.order import check_balance
-from trading.dashboard.dashboard_main import generate_dashboard, generate_combined_dashboard
 from utils.terminal_colors import (
     print_success, print_error, print_warning, print_info, 
-    print_header, Colors
+    print_header, Colors, set_log_level
 )
 from concurrent.futures import ThreadPoolExecutor
 import threading
@@ -22,6 +21,9 @@ active_bots = []
 def main():
     """Main entry point for the high frequency trading bot application"""
     
+    # Apply the configured verbosity (config has loaded .env by now)
+    set_log_level(config.LOG_LEVEL)
+    
     print_header("High Frequency Multi-Cryptocurrency Trading Bot")
     
     # Parse command line arguments
@@ -68,6 +70,9 @@ def main():
     
     # Handle dashboard-only mode
     if args.dashboard_only:
+        # The dashboard (and matplotlib) is only imported when it is rendered
+        from trading.dashboard.dashboard_main import generate_dashboard, generate_combined_dashboard
+        
         print_info("Dashboard generation mode")
         # Generate individual dashboards
         for symbol in symbols:
@@ -186,6 +191,7 @@ def main():
                 thread.join()
     except KeyboardInterrupt:
         print_warning("\nBots stopped by user. Generating final dashboards...")
+        from trading.dashboard.dashboard_main import generate_dashboard, generate_combined_dashboard
         for symbol in symbols:
             symbol_dir = os.path.join(config.DATA_DIR, symbol.replace('/', '_'))
             generate_dashboard(output_dir=symbol_dir)
@@ -199,6 +205,7 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print_warning("\nBot stopped by user. Generating final dashboard...")
+        from trading.dashboard.dashboard_main import generate_dashboard, generate_combined_dashboard
         for bot in active_bots:
             symbol_dir = os.path.join(config.DATA_DIR, bot.symbol.replace('/', '_'))
             generate_dashboard(output_dir=symbol_dir)
@@ -48,6 +48,7 @@ class CryptoTradingBot:
         """
         # Exchange configuration
         self.symbol = symbol.strip()  # Ensure no whitespace
+        self.base_currency, self.quote_currency = self.symbol.split('/')  # Split once, reused every tick
         self.timeframe = timeframe
         self.api_key = api_key
         self.base_url = base_url
@@ -125,18 +126,22 @@ class CryptoTradingBot:
                 # For simplicity, treat all existing balance as a single position with a zero entry price
                 if self.current_position_size > 0:
                     self.position_entry_prices = [(self.current_position_size, 0)]
-                    print_info(f"Recovered existing position of {self.current_position_size} {self.symbol.split('/')[0]}")
+                    print_info(f"Recovered existing position of {self.current_position_size} {self.base_currency}")
             else:
                 # Start a new simulation with default values
-                base_currency = self.symbol.split('/')[0]
-                quote_currency = self.symbol.split('/')[1]
                 self.sim_tracker = SimulationTracker(
                     initial_balance=100.0,  # Start with 100 USDT
-                    base_currency=base_currency,
-                    quote_currency=quote_currency,
+                    base_currency=self.base_currency,
+                    quote_currency=self.quote_currency,
                     data_dir=self.data_dir
                 )
-                print_info(f"Started new simulation with 100 {quote_currency} for {self.symbol}")
+                print_info(f"Started new simulation with 100 {self.quote_currency} for {self.symbol}")
+        
+        # Choose how orders are filled once, so the trading loop never branches on the mode
+        if self.in_simulation_mode:
+            self.trade_executor = self.sim_tracker.execute_trade
+        else:
+            self.trade_executor = self.execute_real_trade
         
         print_header(f"Bot initialized for {self.symbol} on Binance using {timeframe} timeframe")
         
@@ -184,6 +189,20 @@ class CryptoTradingBot:
             print_error(f"Error fetching data: {e}")
             return None
         
+    def execute_real_trade(self, action, amount, price):
+        """
+        Place a market order on the exchange
+        
+        Parameters:
+        action (str): 'buy' or 'sell'
+        amount (float): Amount to trade
+        price (float): Current price (unused, matches SimulationTracker.execute_trade)
+        
+        Returns:
+        bool: True if the order was placed
+        """
+        return execute_trade(action, self.base_url, self.api_key, self.symbol, amount)
+    
     def analyze_market(self, limit=30):
         """
         Analyze market data and calculate signals
@@ -272,8 +291,8 @@ class CryptoTradingBot:
             print_info(f"{symbol_prefix}Using STANDARD MA CROSSOVER strategy with {self.timeframe} candles")
         
         # Print position sizing information
-        print_info(f"{symbol_prefix}Base position size: {self.base_position_size} {self.symbol.split('/')[0]}")
-        print_info(f"{symbol_prefix}Maximum position size: {self.base_position_size * self.max_position_size} {self.symbol.split('/')[0]} "
+        print_info(f"{symbol_prefix}Base position size: {self.base_position_size} {self.base_currency}")
+        print_info(f"{symbol_prefix}Maximum position size: {self.base_position_size * self.max_position_size} {self.base_currency} "
                   f"({self.max_position_size}x base size)")
         
         print_info(f"{symbol_prefix}Moving average windows: {self.short_window}/{self.long_window}")
@@ -5,38 +5,46 @@ Chart plotting functions for combined multi-symbol dashboard
 import os
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.ticker import FuncFormatter
-import json
-from trading.dashboard.dashboard_utils import load_simulation_data
+from trading.dashboard.dashboard_utils import (
+    load_simulation_data, load_simulation_data_cached, downsample_series,
+    calculate_rolling_volatility
+)
 
 def plot_trading_activity_by_symbol(ax, symbol_dirs, output_dir):
     """Plot trading activity breakdown by symbol"""
-    # Count trades by symbol
-    trade_counts = {}
-    trade_buys = {}
-    trade_sells = {}
+    # Gather every symbol's actions into one frame and count them together
+    symbols_with_data = []
+    symbol_column = []
+    action_column = []
     
     for symbol_dir in symbol_dirs:
         symbol = symbol_dir.replace('_', '/')
         data_file = os.path.join(output_dir, symbol_dir, 'simulation_data.json')
         
         if os.path.exists(data_file):
-            with open(data_file, 'r') as f:
-                data = json.load(f)
+            data = load_simulation_data_cached(data_file)
             transactions = data.get('transactions', [])
             
-            trade_counts[symbol] = len(transactions)
-            trade_buys[symbol] = sum(1 for t in transactions if t.get('action') == 'buy')
-            trade_sells[symbol] = sum(1 for t in transactions if t.get('action') == 'sell')
+            symbols_with_data.append(symbol)
+            symbol_column.extend([symbol] * len(transactions))
+            action_column.extend(t.get('action') for t in transactions)
+    
+    # Categoricals keep symbols without trades in the counts and leave
+    # anything other than buy/sell out of the stacked bars
+    activity = pd.DataFrame({
+        'symbol': pd.Categorical(symbol_column, categories=symbols_with_data),
+        'action': pd.Categorical(action_column, categories=['buy', 'sell'])
+    })
+    action_counts = activity.groupby(['symbol', 'action'], observed=False).size().unstack()
     
     # Sort by trade count
-    symbols_by_trades = sorted(trade_counts.keys(), key=lambda x: trade_counts[x], reverse=True)
+    trade_counts = activity['symbol'].value_counts(sort=False).sort_values(ascending=False, kind='stable')
+    symbols_by_trades = list(trade_counts.index)
     
     # Plot stacked bar chart
     if symbols_by_trades:
-        buys = [trade_buys.get(s, 0) for s in symbols_by_trades]
-        sells = [trade_sells.get(s, 0) for s in symbols_by_trades]
+        buys = action_counts.loc[symbols_by_trades, 'buy'].to_numpy()
+        sells = action_counts.loc[symbols_by_trades, 'sell'].to_numpy()
         
         ax.bar(symbols_by_trades, buys, label='Buy', color='g', alpha=0.7)
         ax.bar(symbols_by_trades, sells, bottom=buys, label='Sell', color='r', alpha=0.7)
@@ -69,8 +77,7 @@ def plot_aggregate_metrics(ax, combined_df, symbol_dirs, output_dir, symbols):
         data_file = os.path.join(output_dir, symbol_dir, 'simulation_data.json')
         
         if os.path.exists(data_file):
-            with open(data_file, 'r') as f:
-                data = json.load(f)
+            data = load_simulation_data_cached(data_file)
             
             balance_history = data.get('balance_history', [])
             transactions = data.get('transactions', [])
@@ -132,25 +139,25 @@ def plot_price_correlation(ax, combined_df, symbols):
     """Plot price correlation heatmap between symbols"""
     # Create price correlation matrix if we have enough symbols
     if len(symbols) > 1:
-        # Create a dataframe with prices for each symbol
-        price_data = {}
-        
-        for symbol in symbols:
-            symbol_data = combined_df[combined_df['symbol'] == symbol]
-            # Resample to a common time grid (1 minute intervals)
-            symbol_data.set_index('timestamp', inplace=True)
-            resampled = symbol_data['price'].resample('1min').last().fillna(method='ffill')
-            price_data[symbol] = resampled
-        
-        # Create a DataFrame with all prices
-        price_df = pd.DataFrame(price_data)
+        # Pivot prices into one column per symbol and resample them all to a
+        # common 1 minute grid at once; gaps are only filled inside each
+        # symbol's own time range
+        price_df = combined_df.pivot_table(index='timestamp', columns='symbol', values='price', aggfunc='last')
+        price_df = price_df.resample('1min').last().ffill(limit_area='inside').reindex(columns=symbols)
         
-        # Calculate correlation matrix
-        corr_matrix = price_df.corr()
+        # Calculate correlation matrix in one NumPy call when every symbol has a
+        # price for every minute; gaps need pandas' pairwise-complete handling
+        prices = price_df.to_numpy(dtype=np.float64)
+        if np.isnan(prices).any():
+            corr_matrix = price_df.corr()
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr_matrix = pd.DataFrame(np.corrcoef(prices, rowvar=False),
+                                           index=price_df.columns, columns=price_df.columns)
         
         # Plot correlation heatmap
         im = ax.imshow(corr_matrix, cmap='coolwarm', vmin=-1, vmax=1)
-        plt.colorbar(im, ax=ax)
+        ax.figure.colorbar(im, ax=ax)
         
         # Set ticks and labels
         ax.set_xticks(np.arange(len(symbols)))
@@ -158,11 +165,16 @@ def plot_price_correlation(ax, combined_df, symbols):
         ax.set_xticklabels(symbols, rotation=45, ha='right')
         ax.set_yticklabels(symbols)
         
-        # Loop over data dimensions and create text annotations
+        # Annotate each cell from the raw array; the matrix is symmetric, so
+        # format each pair once and place it on both sides of the diagonal
+        corr_values = corr_matrix.to_numpy()
+        text_colors = np.where(np.abs(corr_values) < 0.7, 'black', 'white')
         for i in range(len(symbols)):
-            for j in range(len(symbols)):
-                text = ax.text(j, i, f"{corr_matrix.iloc[i, j]:.2f}",
-                            ha="center", va="center", color="black" if abs(corr_matrix.iloc[i, j]) < 0.7 else "white")
+            for j in range(i, len(symbols)):
+                label = f"{corr_values[i, j]:.2f}"
+                ax.text(j, i, label, ha="center", va="center", color=text_colors[i, j])
+                if i != j:
+                    ax.text(i, j, label, ha="center", va="center", color=text_colors[j, i])
         
         ax.set_title('Price Correlation Between Symbols')
     else:
@@ -172,17 +184,16 @@ def plot_price_correlation(ax, combined_df, symbols):
 
 def plot_volatility_comparison(ax, combined_df, symbols):
     """Plot volatility comparison across symbols"""
-    # Calculate and plot volatility for each symbol
-    for symbol in symbols:
-        symbol_data = combined_df[combined_df['symbol'] == symbol]
-        if len(symbol_data) > 10 and 'price' in symbol_data.columns:
-            # Calculate rolling volatility
-            symbol_data = symbol_data.sort_values('timestamp')
-            symbol_data['price_pct_change'] = symbol_data['price'].pct_change() * 100
-            symbol_data['volatility'] = symbol_data['price_pct_change'].rolling(10).std()
-            
-            # Plot volatility
-            ax.plot(symbol_data['timestamp'], symbol_data['volatility'], label=symbol)
+    # Calculate and plot volatility for each symbol, partitioning the frame once
+    if 'price' in combined_df.columns:
+        for symbol, symbol_data in combined_df.groupby('symbol', sort=False):
+            if len(symbol_data) > 10:
+                # Calculate rolling volatility
+                symbol_data = symbol_data.sort_values('timestamp')
+                volatility = calculate_rolling_volatility(symbol_data['price'].to_numpy(), window=10)
+                
+                # Plot volatility
+                ax.plot(*downsample_series(symbol_data['timestamp'], volatility), label=symbol)
     
     ax.set_title('Price Volatility Comparison')
     ax.set_ylabel('Volatility (% Std Dev)')
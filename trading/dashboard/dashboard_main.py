@@ -4,6 +4,7 @@ Main entry point for dashboard generation
 
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from trading.dashboard.dashboard_single import generate_dashboard
 from trading.dashboard.dashboard_combined import generate_combined_dashboard
 from utils.terminal_colors import (
@@ -42,13 +43,33 @@ def dashboard_command():
             symbol_dirs = [d for d in os.listdir(args.dir) 
                          if os.path.isdir(os.path.join(args.dir, d)) and d != 'dashboard' and d != 'combined_dashboard']
             
-            for symbol_dir in symbol_dirs:
-                full_dir = os.path.join(args.dir, symbol_dir)
-                symbol = symbol_dir.replace('_', '/')
-                print_info(f"Generating dashboard for {symbol}...")
-                generate_dashboard(full_dir)
+            # Each symbol's dashboard is independent, so render them in separate processes
+            max_workers = max(1, min(len(symbol_dirs), os.cpu_count() or 1))
+            failed_symbols = []
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for symbol_dir in symbol_dirs:
+                    symbol = symbol_dir.replace('_', '/')
+                    print_info(f"Generating dashboard for {symbol}...")
+                    futures[symbol] = executor.submit(generate_dashboard, os.path.join(args.dir, symbol_dir))
+                
+                for symbol, future in futures.items():
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        print_error(f"Error generating dashboard for {symbol}: {e}")
+                        success = False
+                    
+                    if success:
+                        print_success(f"Dashboard for {symbol} generated successfully!")
+                    else:
+                        print_error(f"Failed to generate dashboard for {symbol}.")
+                        failed_symbols.append(symbol)
             
-            print_success("All individual dashboards generated successfully!")
+            if failed_symbols:
+                print_error(f"Failed to generate {len(failed_symbols)} of {len(symbol_dirs)} dashboards: {', '.join(failed_symbols)}")
+            else:
+                print_success("All individual dashboards generated successfully!")
             
             # Also generate the combined dashboard
             if generate_combined_dashboard(args.dir):
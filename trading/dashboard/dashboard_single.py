@@ -4,11 +4,8 @@ Single symbol dashboard generation
 
 import os
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 from matplotlib.ticker import FuncFormatter
 import numpy as np
-import json
 from datetime import datetime
 from utils.terminal_colors import (
     print_success, print_error, print_warning, print_info, 
@@ -16,8 +13,9 @@ from utils.terminal_colors import (
 )
 from trading.dashboard.dashboard_utils import (
     dollar_formatter, load_simulation_data, prepare_balance_dataframe,
-    prepare_transaction_dataframe, calculate_trade_metrics,
-    setup_figure, format_dates_on_axes
+    prepare_transaction_dataframe, calculate_trade_metrics, calculate_max_drawdown,
+    setup_figure, format_dates_on_axes, downsample_series, DASHBOARD_DPI,
+    get_data_fingerprint, is_dashboard_current, save_dashboard_fingerprint
 )
 from trading.dashboard.dashboard_single_charts import (
     plot_performance_chart, plot_trade_distribution, plot_trade_frequency,
@@ -25,12 +23,14 @@ from trading.dashboard.dashboard_single_charts import (
     plot_trade_size_distribution, generate_trade_activity_heatmap, generate_volatility_chart
 )
 
-def generate_dashboard(output_dir='simulation_data'):
+def generate_dashboard(output_dir='simulation_data', data=None):
     """
     Generate a comprehensive dashboard for the high frequency trading bot
     
     Parameters:
     output_dir (str): Directory to read data from and save charts to
+    data (dict, optional): Simulation data already in memory, laid out like
+        simulation_data.json; when given the data file is not read
     
     Returns:
     bool: Success indicator
@@ -41,10 +41,28 @@ def generate_dashboard(output_dir='simulation_data'):
         
         # Load data file
         data_file = os.path.join(output_dir, 'simulation_data.json')
-        balance_history, transactions = load_simulation_data(data_file)
+        dashboard_dir = os.path.join(output_dir, 'dashboard')
         
-        if balance_history is None:
-            return False
+        if data is not None:
+            # In-memory data has no file fingerprint, so always render it
+            fingerprint = None
+            balance_history = data.get('balance_history')
+            transactions = data.get('transactions', [])
+            
+            if not balance_history:
+                print_error("No balance history found in simulation data")
+                return False
+        else:
+            # Skip regeneration when the data has not changed since the last render
+            fingerprint = get_data_fingerprint(data_file)
+            if is_dashboard_current(dashboard_dir, fingerprint, 'hft_dashboard.png'):
+                print_info(f"Dashboard for {symbol} is up to date")
+                return True
+            
+            balance_history, transactions = load_simulation_data(data_file)
+            
+            if balance_history is None:
+                return False
         
         # Prepare data frames
         balance_df = prepare_balance_dataframe(balance_history)
@@ -55,13 +73,12 @@ def generate_dashboard(output_dir='simulation_data'):
         current_value = balance_df['total_value_in_quote'].iloc[-1]
         absolute_return = current_value - initial_value
         percent_return = (absolute_return / initial_value) * 100
-        max_drawdown = balance_df['drawdown'].min()
+        max_drawdown = calculate_max_drawdown(balance_df['total_value_in_quote'])
         
         # Calculate trade metrics
-        trade_metrics = calculate_trade_metrics(transactions, initial_value)
+        trade_metrics = calculate_trade_metrics(transactions, initial_value, trans_df)
         
         # Create a subdirectory for the dashboard
-        dashboard_dir = os.path.join(output_dir, 'dashboard')
         os.makedirs(dashboard_dir, exist_ok=True)
         
         print_info(f"Generating high frequency dashboard for {symbol} from {len(balance_history)} data points...")
@@ -74,12 +91,14 @@ def generate_dashboard(output_dir='simulation_data'):
         )
         
         # Generate additional charts if we have enough data
-        if trans_df is not None and len(trans_df) > 10:
-            generate_trade_activity_heatmap(symbol, trans_df, dashboard_dir)
+        if transactions and len(transactions) > 10:
+            generate_trade_activity_heatmap(symbol, transactions, dashboard_dir)
         
         if len(balance_df) > 10:
             generate_volatility_chart(symbol, balance_df, dashboard_dir)
         
+        save_dashboard_fingerprint(dashboard_dir, fingerprint)
+        
         # Print summary in terminal
         print_header(f"High Frequency Trading Dashboard for {symbol} Generation Complete")
         print_info(f"Initial Balance: ${initial_value:.2f}")
@@ -109,71 +128,77 @@ def generate_main_dashboard(
     
     # Create a multi-panel dashboard
     fig = setup_figure(f'High Frequency Trading Bot Simulation Dashboard - {symbol}')
-    gs = fig.add_gridspec(4, 3)
-    
-    # 1. Total Value Over Time
-    ax1 = fig.add_subplot(gs[0, :])
-    ax1.plot(balance_df['timestamp'], balance_df['total_value_in_quote'], 'b-', linewidth=2)
-    ax1.set_title('Total Portfolio Value')
-    ax1.set_ylabel('Value (USDT)')
-    ax1.yaxis.set_major_formatter(FuncFormatter(dollar_formatter))
-    ax1.grid(True)
-    
-    # Add buy/sell markers if transactions exist
-    if trans_df is not None:
-        add_trade_markers(ax1, trans_df, balance_df, initial_value)
-    
-    ax1.legend()
-    
-    # 2. Price History
-    ax2 = fig.add_subplot(gs[1, 0:2])
-    ax2.plot(balance_df['timestamp'], balance_df['price'], 'r-', linewidth=2)
-    ax2.set_title(f'Price History - {symbol}')
-    ax2.set_ylabel('Price (USDT)')
-    ax2.yaxis.set_major_formatter(FuncFormatter(dollar_formatter))
-    ax2.grid(True)
-    
-    # 3. Performance (%)
-    ax3 = fig.add_subplot(gs[1, 2])
-    plot_performance_chart(ax3, balance_df)
-    
-    # 4. Trade distribution
-    ax4 = fig.add_subplot(gs[2, 0])
-    plot_trade_distribution(ax4, trans_df)
-    
-    # 5. Trade Frequency Over Time
-    ax5 = fig.add_subplot(gs[2, 1])
-    plot_trade_frequency(ax5, trans_df)
-    
-    # 6. Performance metrics
-    ax6 = fig.add_subplot(gs[2, 2])
-    plot_performance_metrics(
-        ax6, symbol, initial_value, current_value, 
-        absolute_return, percent_return, max_drawdown, 
-        trade_metrics, balance_df
-    )
-    
-    # 7. Trade profit distribution
-    ax7 = fig.add_subplot(gs[3, 0])
-    plot_profit_distribution(ax7, trade_metrics['profits'])
-    
-    # 8. Hourly performance
-    ax8 = fig.add_subplot(gs[3, 1])
-    plot_hourly_performance(ax8, balance_df)
-    
-    # 9. Trade size distribution
-    ax9 = fig.add_subplot(gs[3, 2])
-    plot_trade_size_distribution(ax9, trans_df)
-    
-    # Format dates on x-axis
-    format_dates_on_axes([ax1, ax2, ax3, ax5])
-    
-    plt.tight_layout(rect=[0, 0.03, 1, 0.97])
-    
-    # Save the dashboard
-    dashboard_path = os.path.join(dashboard_dir, 'hft_dashboard.png')
-    plt.savefig(dashboard_path)
-    plt.close()
+    try:
+        gs = fig.add_gridspec(4, 3)
+    
+        # 1. Total Value Over Time
+        ax1 = fig.add_subplot(gs[0, :])
+        ax1.plot(*downsample_series(balance_df['timestamp'], balance_df['total_value_in_quote']), 'b-', linewidth=2)
+        ax1.set_title('Total Portfolio Value')
+        ax1.set_ylabel('Value (USDT)')
+        ax1.yaxis.set_major_formatter(FuncFormatter(dollar_formatter))
+        ax1.grid(True)
+    
+        # Add buy/sell markers if transactions exist
+        if trans_df is not None:
+            add_trade_markers(ax1, trans_df, balance_df, initial_value)
+    
+        # Only the aggregated marker collections carry labels, so check once
+        # instead of letting legend() warn when no trades were plotted
+        if ax1.get_legend_handles_labels()[1]:
+            ax1.legend()
+    
+        # 2. Price History
+        ax2 = fig.add_subplot(gs[1, 0:2])
+        ax2.plot(*downsample_series(balance_df['timestamp'], balance_df['price']), 'r-', linewidth=2)
+        ax2.set_title(f'Price History - {symbol}')
+        ax2.set_ylabel('Price (USDT)')
+        ax2.yaxis.set_major_formatter(FuncFormatter(dollar_formatter))
+        ax2.grid(True)
+    
+        # 3. Performance (%)
+        ax3 = fig.add_subplot(gs[1, 2])
+        plot_performance_chart(ax3, balance_df)
+    
+        # 4. Trade distribution
+        ax4 = fig.add_subplot(gs[2, 0])
+        plot_trade_distribution(ax4, trans_df)
+    
+        # 5. Trade Frequency Over Time
+        ax5 = fig.add_subplot(gs[2, 1])
+        plot_trade_frequency(ax5, trans_df)
+    
+        # 6. Performance metrics
+        ax6 = fig.add_subplot(gs[2, 2])
+        plot_performance_metrics(
+            ax6, symbol, initial_value, current_value, 
+            absolute_return, percent_return, max_drawdown, 
+            trade_metrics, balance_df
+        )
+    
+        # 7. Trade profit distribution
+        ax7 = fig.add_subplot(gs[3, 0])
+        plot_profit_distribution(ax7, trade_metrics['profits'])
+    
+        # 8. Hourly performance
+        ax8 = fig.add_subplot(gs[3, 1])
+        plot_hourly_performance(ax8, balance_df)
+    
+        # 9. Trade size distribution
+        ax9 = fig.add_subplot(gs[3, 2])
+        plot_trade_size_distribution(ax9, trans_df)
+    
+        # Format dates on x-axis
+        format_dates_on_axes([ax1, ax2, ax3, ax5])
+    
+        fig.tight_layout(rect=[0, 0.03, 1, 0.97])
+    
+        # Save the dashboard
+        dashboard_path = os.path.join(dashboard_dir, 'hft_dashboard.png')
+        fig.savefig(dashboard_path, dpi=DASHBOARD_DPI)
+    finally:
+        # Release the plotted artists; the figure itself is reused
+        fig.clf()
     
     print_success(f"High frequency trading dashboard for {symbol} saved to: {dashboard_path}")
 
@@ -182,31 +207,38 @@ def add_trade_markers(ax, trans_df, balance_df, initial_value):
     # For high frequency trading, limit the number of markers to avoid crowding
     # Only show the most significant trades (e.g., those with largest impact)
     if len(trans_df) > 50:
-        # Calculate trade impact as percentage change in value
-        trans_df['impact'] = abs(trans_df['value'] / initial_value * 100)
+        # Calculate trade impact as percentage change in value, kept as a local
+        # Series so the caller's trans_df is not modified
+        impact = (trans_df['value'] / initial_value * 100).abs()
         
         # Get the top trades by impact
-        buy_markers = trans_df[trans_df['action'] == 'buy'].nlargest(25, 'impact')
-        sell_markers = trans_df[trans_df['action'] == 'sell'].nlargest(25, 'impact')
-        
-        # Plot these significant trades
-        for _, t in buy_markers.iterrows():
-            price = balance_df.loc[balance_df['timestamp'] > t['timestamp'], 'total_value_in_quote'].iloc[0] if not balance_df.loc[balance_df['timestamp'] > t['timestamp']].empty else None
-            if price is not None:
-                ax.scatter(t['timestamp'], price, marker='^', color='g', s=80, zorder=5, label='Buy' if 'Buy' not in ax.get_legend_handles_labels()[1] else "")
-        
-        for _, t in sell_markers.iterrows():
-            price = balance_df.loc[balance_df['timestamp'] > t['timestamp'], 'total_value_in_quote'].iloc[0] if not balance_df.loc[balance_df['timestamp'] > t['timestamp']].empty else None
-            if price is not None:
-                ax.scatter(t['timestamp'], price, marker='v', color='r', s=80, zorder=5, label='Sell' if 'Sell' not in ax.get_legend_handles_labels()[1] else "")
+        top_buys = impact[trans_df['action'] == 'buy'].nlargest(25).index
+        top_sells = impact[trans_df['action'] == 'sell'].nlargest(25).index
+        markers = trans_df.loc[top_buys.append(top_sells)]
     else:
         # If we have fewer trades, show them all
-        for _, t in trans_df.iterrows():
-            if t['action'] == 'buy':
-                price = balance_df.loc[balance_df['timestamp'] > t['timestamp'], 'total_value_in_quote'].iloc[0] if not balance_df.loc[balance_df['timestamp'] > t['timestamp']].empty else None
-                if price is not None:
-                    ax.scatter(t['timestamp'], price, marker='^', color='g', s=80, zorder=5, label='Buy' if 'Buy' not in ax.get_legend_handles_labels()[1] else "")
-            else:  # sell
-                price = balance_df.loc[balance_df['timestamp'] > t['timestamp'], 'total_value_in_quote'].iloc[0] if not balance_df.loc[balance_df['timestamp'] > t['timestamp']].empty else None
-                if price is not None:
-                    ax.scatter(t['timestamp'], price, marker='v', color='r', s=80, zorder=5, label='Sell' if 'Sell' not in ax.get_legend_handles_labels()[1] else "")
\ No newline at end of file
+        markers = trans_df
+    
+    # Look up the portfolio value at the first balance entry after each trade
+    # with a binary search over the sorted balance timestamps
+    if not balance_df['timestamp'].is_monotonic_increasing:
+        balance_df = balance_df.sort_values('timestamp')
+    balance_times = balance_df['timestamp'].to_numpy(dtype='datetime64[ns]')
+    balance_values = balance_df['total_value_in_quote'].to_numpy(dtype=np.float64)
+    
+    marker_times = markers['timestamp'].to_numpy(dtype='datetime64[ns]')
+    idx = np.searchsorted(balance_times, marker_times, side='right')
+    found = idx < len(balance_times)
+    marker_values = np.full(len(idx), np.nan)
+    marker_values[found] = balance_values[idx[found]]
+    
+    valid = ~np.isnan(marker_values)
+    is_buy = (markers['action'] == 'buy').to_numpy()
+    buys = valid & is_buy
+    sells = valid & ~is_buy
+    
+    # One scatter call per action keeps the legend to a single entry each
+    if buys.any():
+        ax.scatter(marker_times[buys], marker_values[buys], marker='^', color='g', s=80, zorder=5, label='Buy')
+    if sells.any():
+        ax.scatter(marker_times[sells], marker_values[sells], marker='v', color='r', s=80, zorder=5, label='Sell')
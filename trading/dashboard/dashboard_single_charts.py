@@ -3,11 +3,15 @@ Chart plotting functions for single symbol dashboard
 """
 
 import os
-import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
-import matplotlib.dates as mdates
 from utils.terminal_colors import print_success
+from trading.dashboard.dashboard_utils import (
+    calculate_rolling_volatility, downsample_series, extract_trade_hours_minutes, DASHBOARD_DPI
+)
+import matplotlib.dates as mdates
+from matplotlib.artist import setp
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 def plot_performance_chart(ax, balance_df):
     """Plot performance chart with positive/negative coloring"""
@@ -15,11 +19,11 @@ def plot_performance_chart(ax, balance_df):
     positive_mask = balance_df['performance'] >= 0
     negative_mask = balance_df['performance'] < 0
     
-    ax.plot(balance_df.loc[positive_mask, 'timestamp'], 
-            balance_df.loc[positive_mask, 'performance'], 
+    ax.plot(*downsample_series(balance_df.loc[positive_mask, 'timestamp'], 
+                               balance_df.loc[positive_mask, 'performance']), 
             'g-', linewidth=2)
-    ax.plot(balance_df.loc[negative_mask, 'timestamp'], 
-            balance_df.loc[negative_mask, 'performance'], 
+    ax.plot(*downsample_series(balance_df.loc[negative_mask, 'timestamp'], 
+                               balance_df.loc[negative_mask, 'performance']), 
             'r-', linewidth=2)
     
     ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
@@ -30,7 +34,9 @@ def plot_performance_chart(ax, balance_df):
 def plot_trade_distribution(ax, trans_df):
     """Plot trade distribution (buy/sell counts)"""
     if trans_df is not None:
+        # Drop actions with no trades so an empty category is not drawn
         trade_types = trans_df['action'].value_counts()
+        trade_types = trade_types[trade_types > 0]
         colors = ['g' if x == 'buy' else 'r' for x in trade_types.index]
         ax.bar(trade_types.index, trade_types.values, color=colors)
         ax.set_title('Trade Distribution')
@@ -43,14 +49,24 @@ def plot_trade_distribution(ax, trans_df):
 def plot_trade_frequency(ax, trans_df):
     """Plot trade frequency over time"""
     if trans_df is not None:
-        # Resample to get trade counts by minute
-        df_copy = trans_df.copy()
-        df_copy.set_index('timestamp', inplace=True)
-        trade_freq = df_copy.resample('1T').size().reset_index()
-        trade_freq.columns = ['timestamp', 'trades_per_minute']
+        # Count trades per minute with a bincount over integer minute offsets,
+        # then keep only the minutes that actually contain trades
+        minutes = trans_df['timestamp'].to_numpy(dtype='datetime64[m]').astype(np.int64)
+        first_minute = minutes.min()
+        span = minutes.max() - first_minute + 1
+        
+        if span <= len(minutes):
+            trade_freq = np.bincount(minutes - first_minute)
+            active = np.flatnonzero(trade_freq)
+            active_minutes, counts = first_minute + active, trade_freq[active]
+        else:
+            # Sparse trades (or an outlier timestamp) would make the bincount
+            # allocate a slot for every empty minute; count the distinct ones
+            active_minutes, counts = np.unique(minutes, return_counts=True)
         
         # Plot trade frequency
-        ax.bar(trade_freq['timestamp'], trade_freq['trades_per_minute'], color='blue', alpha=0.7)
+        ax.bar(active_minutes.astype('datetime64[m]'), counts,
+               color='blue', alpha=0.7, width=np.timedelta64(1, 'm'))
         ax.set_title('Trade Frequency (per minute)')
         ax.set_ylabel('Trades')
         ax.grid(axis='y')
@@ -103,9 +119,11 @@ def plot_performance_metrics(ax, symbol, initial_value, current_value,
 
 def plot_profit_distribution(ax, profits):
     """Plot trade profit distribution histogram"""
-    if profits:
-        profit_bins = np.linspace(min(profits), max(profits), 20)
-        ax.hist(profits, bins=profit_bins, color='blue', alpha=0.7)
+    if len(profits):
+        # Bin with NumPy and draw the bars directly; 19 bins gives the same
+        # 20 evenly spaced edges from min to max as before
+        counts, edges = np.histogram(profits, bins=19)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='blue', alpha=0.7)
         ax.axvline(x=0, color='k', linestyle='--', alpha=0.5)
         ax.set_title('Trade Profit Distribution (%)')
         ax.set_xlabel('Profit/Loss (%)')
@@ -119,8 +137,8 @@ def plot_hourly_performance(ax, balance_df):
     """Plot performance breakdown by hour"""
     if len(balance_df) > 1:
         # Calculate hourly returns
-        balance_df['hour'] = balance_df['timestamp'].dt.hour
-        hourly_data = balance_df.groupby('hour')['performance'].mean().reset_index()
+        # Bars are positioned by hour, so the group keys don't need sorting
+        hourly_data = balance_df.groupby('hour', sort=False)['performance'].mean().reset_index()
         
         bars = ax.bar(hourly_data['hour'], hourly_data['performance'], color=[
             'g' if x >= 0 else 'r' for x in hourly_data['performance']
@@ -148,9 +166,10 @@ def plot_hourly_performance(ax, balance_df):
 def plot_trade_size_distribution(ax, trans_df):
     """Plot trade size distribution histogram"""
     if trans_df is not None:
-        if 'amount' in trans_df.columns:
+        if trans_df['amount'].notna().any():
             # Create histogram of trade sizes
-            ax.hist(trans_df['amount'], bins=20, color='purple', alpha=0.7)
+            counts, edges = np.histogram(trans_df['amount'].dropna().to_numpy(), bins=20)
+            ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='purple', alpha=0.7)
             ax.set_title('Trade Size Distribution')
             ax.set_xlabel('Trade Size')
             ax.set_ylabel('Number of Trades')
@@ -162,65 +181,60 @@ def plot_trade_size_distribution(ax, trans_df):
         ax.text(0.5, 0.5, 'No trades executed yet', horizontalalignment='center', verticalalignment='center', transform=ax.transAxes)
         ax.set_title('Trade Size Distribution')
 
-def generate_trade_activity_heatmap(symbol, trans_df, dashboard_dir):
+def generate_trade_activity_heatmap(symbol, transactions, dashboard_dir):
     """Generate a heatmap of trading activity by hour and minute"""
-    plt.figure(figsize=(15, 8))
+    # A bare Agg figure keeps this render off pyplot's shared current figure,
+    # so dashboards drawn on different threads cannot touch each other
+    fig = Figure(figsize=(15, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
     
-    # Extract hour and minute
-    trans_df['hour'] = trans_df['timestamp'].dt.hour
-    trans_df['minute'] = trans_df['timestamp'].dt.minute
-    
-    # Create pivot table for heatmap
-    heatmap_data = pd.pivot_table(
-        trans_df,
-        values='timestamp',
-        index='hour',
-        columns='minute',
-        aggfunc='count',
-        fill_value=0
-    )
+    # Count trades into a full 24x60 hour/minute grid
+    hours, minutes = extract_trade_hours_minutes(transactions)
+    heatmap_data = np.zeros((24, 60), dtype=np.int32)
+    np.add.at(heatmap_data, (hours, minutes), 1)
     
     # Plot heatmap
-    plt.imshow(heatmap_data, cmap='viridis', aspect='auto', interpolation='nearest')
-    plt.colorbar(label='Number of Trades')
-    plt.title(f'Trade Activity Heatmap by Hour and Minute - {symbol}')
-    plt.xlabel('Minute')
-    plt.ylabel('Hour')
+    image = ax.imshow(heatmap_data, cmap='viridis', aspect='auto', interpolation='nearest')
+    fig.colorbar(image, label='Number of Trades')
+    ax.set_title(f'Trade Activity Heatmap by Hour and Minute - {symbol}')
+    ax.set_xlabel('Minute')
+    ax.set_ylabel('Hour')
     
     # Set x-ticks to show every 5 minutes
-    plt.xticks(np.arange(0, 60, 5), np.arange(0, 60, 5))
-    plt.yticks(np.arange(0, 24), np.arange(0, 24))
+    ax.set_xticks(np.arange(0, 60, 5), np.arange(0, 60, 5))
+    ax.set_yticks(np.arange(0, 24), np.arange(0, 24))
     
     heatmap_path = os.path.join(dashboard_dir, 'trade_activity_heatmap.png')
-    plt.tight_layout()
-    plt.savefig(heatmap_path)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(heatmap_path, dpi=DASHBOARD_DPI)
     
     print_success(f"Trade activity heatmap for {symbol} saved to: {heatmap_path}")
 
 def generate_volatility_chart(symbol, balance_df, dashboard_dir):
     """Generate a price volatility chart for intraday analysis"""
-    plt.figure(figsize=(15, 6))
-    
     # Calculate price volatility (rolling std of price changes)
     if 'price' in balance_df.columns:
-        balance_df['price_pct_change'] = balance_df['price'].pct_change() * 100
-        balance_df['volatility'] = balance_df['price_pct_change'].rolling(10).std()
+        fig = Figure(figsize=(15, 6))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        
+        volatility = calculate_rolling_volatility(balance_df['price'].to_numpy(), window=10)
+        timestamps, volatility = downsample_series(balance_df['timestamp'], volatility)
         
         # Plot volatility
-        plt.plot(balance_df['timestamp'], balance_df['volatility'], 'b-', linewidth=2)
-        plt.fill_between(balance_df['timestamp'], balance_df['volatility'], color='blue', alpha=0.2)
-        plt.title(f'Price Volatility (10-period Rolling Standard Deviation) - {symbol}')
-        plt.ylabel('Volatility (%)')
-        plt.grid(True)
+        ax.plot(timestamps, volatility, 'b-', linewidth=2)
+        ax.fill_between(timestamps, volatility, color='blue', alpha=0.2)
+        ax.set_title(f'Price Volatility (10-period Rolling Standard Deviation) - {symbol}')
+        ax.set_ylabel('Volatility (%)')
+        ax.grid(True)
         
         # Format x-axis dates
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-        plt.setp(plt.gca().xaxis.get_majorticklabels(), rotation=45)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+        setp(ax.xaxis.get_majorticklabels(), rotation=45)
         
         volatility_path = os.path.join(dashboard_dir, 'price_volatility.png')
-        plt.tight_layout()
-        plt.savefig(volatility_path)
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(volatility_path, dpi=DASHBOARD_DPI)
         
         print_success(f"Price volatility chart for {symbol} saved to: {volatility_path}")
\ No newline at end of file
@@ -2,17 +2,42 @@
 Utility functions for dashboard generation
 """
 
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend that doesn't require a GUI window
-import matplotlib.pyplot as plt
-from matplotlib.ticker import FuncFormatter
 import pandas as pd
 import numpy as np
-import matplotlib.dates as mdates
 import os
-import json
+import threading
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend that doesn't require a GUI window
+import matplotlib.dates as mdates
+from matplotlib.artist import setp
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from utils.json_utils import load_json_file
 from utils.terminal_colors import print_success, print_error, print_warning, print_info
 
+# Maximum number of points drawn per line; longer series are downsampled
+MAX_PLOT_POINTS = 3000
+
+# Fixed output resolution so render cost does not depend on local rcParams
+DASHBOARD_DPI = 100
+
+# Transaction fields used by the dashboards; the rest of each record is not loaded
+TRANSACTION_COLUMNS = ['timestamp', 'action', 'amount', 'price', 'value']
+TRANSACTION_FLOAT_COLUMNS = ['amount', 'price', 'value']
+
+# Fixed action categories, so 'buy' is always code 0 and 'sell' code 1
+TRANSACTION_ACTIONS = pd.CategoricalDtype(['buy', 'sell'])
+
+# Sidecar file storing the fingerprint of the data a dashboard was built from
+DASHBOARD_CACHE_FILE = '.cache_key'
+
+# Dashboard figures reused between renders, keyed by size; kept per thread
+# because matplotlib figures must not be shared across threads
+_figure_cache = threading.local()
+
+# Parsed simulation data keyed by file path, reused while the file is unchanged
+_json_cache = {}
+
 def dollar_formatter(x, pos):
     """Format y-axis values as dollars"""
     return f'${x:.2f}'
@@ -33,8 +58,7 @@ def load_simulation_data(data_file):
             return None, None
         
         # Load simulation data
-        with open(data_file, 'r') as f:
-            data = json.load(f)
+        data = load_simulation_data_cached(data_file)
         
         balance_history = data.get('balance_history', [])
         transactions = data.get('transactions', [])
@@ -49,6 +73,71 @@ def load_simulation_data(data_file):
         print_error(f"Error loading simulation data: {e}")
         return None, None
 
+def load_simulation_data_cached(data_file):
+    """
+    Load a simulation data file, reusing the parsed result while its
+    mtime and size are unchanged
+    
+    The returned dict is shared between callers and must not be modified
+    
+    Parameters:
+    data_file (str): Path to the JSON file
+    
+    Returns:
+    dict: Parsed simulation data
+    """
+    fingerprint = get_data_fingerprint(data_file)
+    cached = _json_cache.get(data_file)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    data = load_json_file(data_file)
+    _json_cache[data_file] = (fingerprint, data)
+    return data
+
+def get_data_fingerprint(data_file):
+    """
+    Build a cheap change marker for a data file from its mtime and size
+
+    Parameters:
+    data_file (str): Path to the JSON file
+
+    Returns:
+    str: Fingerprint string, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(data_file)
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+def is_dashboard_current(dashboard_dir, fingerprint, dashboard_file):
+    """
+    Check whether a dashboard was already rendered from the same data
+
+    Parameters:
+    dashboard_dir (str): Directory holding the rendered charts
+    fingerprint (str): Fingerprint of the source data
+    dashboard_file (str): Name of the main chart that must already exist
+
+    Returns:
+    bool: True if the charts can be reused as they are
+    """
+    if fingerprint is None or not os.path.exists(os.path.join(dashboard_dir, dashboard_file)):
+        return False
+    try:
+        with open(os.path.join(dashboard_dir, DASHBOARD_CACHE_FILE)) as f:
+            return f.read() == fingerprint
+    except OSError:
+        return False
+
+def save_dashboard_fingerprint(dashboard_dir, fingerprint):
+    """Record the fingerprint of the data a dashboard was rendered from"""
+    if fingerprint is None:
+        return
+    with open(os.path.join(dashboard_dir, DASHBOARD_CACHE_FILE), 'w') as f:
+        f.write(fingerprint)
+
 def prepare_balance_dataframe(balance_history, symbol=None):
     """
     Prepare a DataFrame from balance history
@@ -62,23 +151,38 @@ def prepare_balance_dataframe(balance_history, symbol=None):
     """
     # Convert to DataFrame
     balance_df = pd.DataFrame(balance_history)
-    balance_df['timestamp'] = pd.to_datetime(balance_df['timestamp'])
+    balance_df['timestamp'] = pd.to_datetime(balance_df['timestamp'], cache=True)
+    
+    # Hour of day for the hourly performance panel; int8 keeps the groupby keys small
+    balance_df['hour'] = balance_df['timestamp'].dt.hour.astype('int8')
     
     # Add symbol if provided
     if symbol:
         balance_df['symbol'] = symbol
     
-    # Add performance metrics
-    initial_value = balance_df['total_value_in_quote'].iloc[0]
-    balance_df['performance'] = (balance_df['total_value_in_quote'] / initial_value - 1) * 100
+    # Add performance metrics, computed on the raw array to skip Series
+    # alignment and the intermediate Series each operator would allocate
+    values = balance_df['total_value_in_quote'].to_numpy(dtype=np.float64)
+    initial_value = values[0]
+    balance_df['performance'] = (values / initial_value - 1) * 100
     balance_df['initial_value'] = initial_value
     
-    # Calculate drawdown
-    balance_df['rolling_max'] = balance_df['total_value_in_quote'].cummax()
-    balance_df['drawdown'] = (balance_df['total_value_in_quote'] / balance_df['rolling_max'] - 1) * 100
-    
     return balance_df
 
+def calculate_max_drawdown(values):
+    """
+    Calculate the maximum drawdown of a value series
+    
+    Parameters:
+    values (array-like): Portfolio values over time
+    
+    Returns:
+    float: Maximum drawdown as a (negative) percentage
+    """
+    values = np.asarray(values, dtype=np.float64)
+    running_max = np.fmax.accumulate(values)
+    return float(np.nanmin(values / running_max - 1) * 100)
+
 def prepare_transaction_dataframe(transactions):
     """
     Prepare a DataFrame from transaction history
@@ -92,19 +196,74 @@ def prepare_transaction_dataframe(transactions):
     if not transactions:
         return None
         
-    # Convert to DataFrame
-    trans_df = pd.DataFrame(transactions)
-    trans_df['timestamp'] = pd.to_datetime(trans_df['timestamp'])
+    # Convert to DataFrame, building only the columns the charts use
+    trans_df = pd.DataFrame.from_records(transactions, columns=TRANSACTION_COLUMNS)
+    trans_df = trans_df.astype({column: 'float64' for column in TRANSACTION_FLOAT_COLUMNS})
+    trans_df['timestamp'] = pd.to_datetime(trans_df['timestamp'], cache=True)
+    
+    # Store the few distinct actions as a categorical so buy/sell masks and
+    # counts compare small integer codes instead of Python strings
+    trans_df['action'] = trans_df['action'].astype(TRANSACTION_ACTIONS)
     
     return trans_df
 
-def calculate_trade_metrics(transactions, initial_value):
+def extract_trade_hours_minutes(transactions):
+    """
+    Extract the hour and minute of each trade for the activity heatmap
+    
+    Parameters:
+    transactions (list): List of transaction records
+    
+    Returns:
+    tuple: (hours, minutes) as integer numpy arrays
+    """
+    timestamps = [t['timestamp'] for t in transactions]
+    
+    # ISO-8601 strings keep the hour and minute at fixed offsets, so slice
+    # them out instead of parsing full timestamps
+    if all(isinstance(ts, str) for ts in timestamps):
+        count = len(timestamps)
+        hours = np.fromiter((int(ts[11:13]) for ts in timestamps), dtype=np.int8, count=count)
+        minutes = np.fromiter((int(ts[14:16]) for ts in timestamps), dtype=np.int8, count=count)
+        return hours, minutes
+    
+    parsed = pd.to_datetime(pd.Series(timestamps))
+    return parsed.dt.hour.to_numpy(), parsed.dt.minute.to_numpy()
+
+def calculate_rolling_volatility(prices, window=10):
+    """
+    Calculate rolling volatility (standard deviation of percentage price changes)
+    
+    Equivalent to pct_change() * 100 followed by rolling(window).std(), computed
+    in a single NumPy pass over a sliding window view
+    
+    Parameters:
+    prices (array-like): Price series
+    window (int): Rolling window size
+    
+    Returns:
+    numpy.ndarray: Volatility values (NaN until the window is filled)
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    pct_change = np.full_like(prices, np.nan)
+    pct_change[1:] = (prices[1:] / prices[:-1] - 1) * 100
+    
+    volatility = np.full_like(prices, np.nan)
+    if len(prices) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(pct_change, window)
+        volatility[window - 1:] = windows.std(axis=1, ddof=1)
+    
+    return volatility
+
+def calculate_trade_metrics(transactions, initial_value, trans_df=None):
     """
     Calculate trade metrics from transaction history
     
     Parameters:
     transactions (list): List of transaction records
     initial_value (float): Initial portfolio value
+    trans_df (pandas.DataFrame, optional): Already prepared transaction DataFrame,
+        reused to avoid rebuilding it and re-parsing timestamps
     
     Returns:
     dict: Dictionary of trade metrics
@@ -117,20 +276,25 @@ def calculate_trade_metrics(transactions, initial_value):
             'trades_per_minute': 0,
             'win_rate': 0,
             'avg_profit': 0,
-            'profits': []
+            'profits': np.array([])
         }
     
-    # Create DataFrame
-    trans_df = pd.DataFrame(transactions)
+    # Reuse the prepared DataFrame when available
+    if trans_df is None:
+        trans_df = prepare_transaction_dataframe(transactions)
+    
+    # Basic counts, taken from boolean masks over the integer category codes
+    # instead of filtered copies of the frame
+    codes = trans_df['action'].cat.codes.to_numpy()
+    is_buy = codes == TRANSACTION_ACTIONS.categories.get_loc('buy')
+    is_sell = codes == TRANSACTION_ACTIONS.categories.get_loc('sell')
     
-    # Basic counts
     num_trades = len(transactions)
-    buy_count = len(trans_df[trans_df['action'] == 'buy'])
-    sell_count = len(trans_df[trans_df['action'] == 'sell'])
+    buy_count = int(np.count_nonzero(is_buy))
+    sell_count = int(np.count_nonzero(is_sell))
     
     # Calculate trades per minute
     if len(trans_df) >= 2:
-        trans_df['timestamp'] = pd.to_datetime(trans_df['timestamp'])
         start_time = trans_df['timestamp'].min()
         end_time = trans_df['timestamp'].max()
         duration_minutes = (end_time - start_time).total_seconds() / 60
@@ -143,24 +307,20 @@ def calculate_trade_metrics(transactions, initial_value):
         trades_per_minute = 0
     
     # Calculate win rate for completed trade pairs
-    buy_prices = []
-    sell_prices = []
-    profits = []
-    
-    for t in transactions:
-        if t['action'] == 'buy':
-            buy_prices.append(t['price'])
-        elif t['action'] == 'sell' and buy_prices:
-            sell_prices.append(t['price'])
-            # Calculate profit/loss for completed trades
-            if buy_prices and sell_prices:
-                buy_price = buy_prices.pop(0)  # FIFO
-                sell_price = sell_prices[-1]
-                profit = (sell_price / buy_price - 1) * 100
-                profits.append(profit)
-    
-    win_rate = sum(1 for p in profits if p > 0) / len(profits) * 100 if profits else 0
-    avg_profit = sum(profits) / len(profits) if profits else 0
+    # Pair the k-th matched sell with the k-th buy (FIFO). A sell that arrives
+    # while no buy is open is skipped, which is tracked by the running maximum
+    # of sells in excess of buys.
+    prices = trans_df['price'].to_numpy(dtype=np.float64)
+    
+    unmatched_sells = np.maximum.accumulate(np.maximum(np.cumsum(is_sell) - np.cumsum(is_buy), 0))
+    matched_sells = is_sell & (np.diff(unmatched_sells, prepend=0) == 0)
+    
+    sell_prices = prices[matched_sells]
+    buy_prices = prices[is_buy][:len(sell_prices)]
+    profits = (sell_prices / buy_prices - 1) * 100
+    
+    win_rate = float((profits > 0).mean() * 100) if len(profits) else 0
+    avg_profit = float(profits.mean()) if len(profits) else 0
     
     return {
         'num_trades': num_trades,
@@ -172,9 +332,95 @@ def calculate_trade_metrics(transactions, initial_value):
         'profits': profits
     }
 
+def minmax_indices(y, n_out=MAX_PLOT_POINTS):
+    """
+    Select the indices of points to keep: the minimum and maximum of each of
+    n_out // 2 equal buckets, plus the first and last points
+    
+    Runs as a few array operations, so its cost grows with len(y) rather than
+    with the number of buckets
+    
+    Parameters:
+    y (numpy.ndarray): Numeric y values
+    n_out (int): Maximum number of points to keep
+    
+    Returns:
+    numpy.ndarray: Sorted indices of the selected points
+    """
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    
+    # Pad to whole buckets; padding and NaNs never win the min/max
+    n_buckets = (n_out - 2) // 2
+    size = -(-n // n_buckets)
+    nan = np.isnan(y)
+    low = np.full(n_buckets * size, np.inf)
+    low[:n] = np.where(nan, np.inf, y)
+    high = np.full(n_buckets * size, -np.inf)
+    high[:n] = np.where(nan, -np.inf, y)
+    
+    offsets = np.arange(n_buckets) * size
+    mins = offsets + low.reshape(n_buckets, size).argmin(axis=1)
+    maxs = offsets + high.reshape(n_buckets, size).argmax(axis=1)
+    
+    indices = np.concatenate(([0, n - 1], mins, maxs))
+    return np.unique(indices[indices < n])
+
+def downsample_series(timestamps, values, n_out=MAX_PLOT_POINTS):
+    """
+    Downsample a time series for plotting while preserving its visual shape
+    
+    Parameters:
+    timestamps (pandas.Series or numpy.ndarray): Datetime x values
+    values (pandas.Series or numpy.ndarray): y values
+    n_out (int): Maximum number of points to keep
+    
+    Returns:
+    tuple: (timestamps, values) limited to at most n_out points
+    """
+    if len(timestamps) <= n_out:
+        return timestamps, values
+    
+    indices = minmax_indices(np.asarray(values, dtype=np.float64), n_out)
+    
+    def take(data):
+        return data.iloc[indices] if hasattr(data, 'iloc') else np.asarray(data)[indices]
+    
+    return take(timestamps), take(values)
+
 def setup_figure(title, figsize=(18, 14)):
-    """Create and setup a figure with title"""
-    fig = plt.figure(figsize=figsize)
+    """
+    Create and setup a figure with title
+    
+    The figure is an Agg-backed Figure outside pyplot's figure manager and is
+    reused for every dashboard of the same size rendered on this thread, so
+    callers must clear it with fig.clf() once it has been saved
+    
+    Parameters:
+    title (str): Figure title
+    figsize (tuple): Figure size in inches
+    
+    Returns:
+    matplotlib.figure.Figure: Empty figure with the title set
+    """
+    figures = getattr(_figure_cache, 'figures', None)
+    if figures is None:
+        figures = _figure_cache.figures = {}
+    
+    fig = figures.get(figsize)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        figures[figsize] = fig
+    else:
+        # clf() keeps the spacing tight_layout chose last time; start from the
+        # defaults again so the layout matches a freshly created figure
+        fig.subplotpars.update(**{
+            key: matplotlib.rcParams[f'figure.subplot.{key}']
+            for key in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+        })
+    
     fig.suptitle(title, fontsize=18)
     return fig
 
@@ -182,4 +428,4 @@ def format_dates_on_axes(axes_list):
     """Format dates on x-axis for multiple axes"""
     for ax in axes_list:
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
\ No newline at end of file
+        setp(ax.xaxis.get_majorticklabels(), rotation=45)
\ No newline at end of file
@@ -6,16 +6,46 @@ Coordinates the overall execution flow of the trading bot.
 import time
 import config  # Import the config module directly
 from datetime import datetime
-from trading.dashboard.dashboard_main import generate_dashboard
 from trading.market_analysis import fetch_ohlcv_data, analyze_market
 from trading.execution.trade_execution import process_signals
 from trading.execution.market_display import display_market_info
 from trading.execution.simulation_reporting import log_simulation_state
+from utils.background import submit_background
 from utils.terminal_colors import (
     print_success, print_error, print_warning, print_info, 
-    print_header, print_simulation, format_profit, format_percentage, Colors
+    print_header, print_simulation, format_profit, format_percentage, Colors,
+    buffered_output, info_enabled
 )
 
+def request_dashboard(data_dir, sim_tracker=None):
+    """
+    Queue a background dashboard render unless one is already waiting
+    
+    Parameters:
+    data_dir (str): Directory holding the symbol's simulation data
+    sim_tracker (SimulationTracker, optional): Tracker whose in-memory history
+        is rendered instead of re-reading it from disk
+    
+    Returns:
+    bool: True if a new render was queued
+    """
+    return submit_background(('dashboard', data_dir), _render_dashboard, data_dir, sim_tracker)
+
+def _render_dashboard(data_dir, sim_tracker):
+    """
+    Render a dashboard on the background thread, loading the plotting stack on first use
+    
+    Errors are reported here since nothing waits on the background job's result
+    """
+    try:
+        from trading.dashboard.dashboard_main import generate_dashboard
+        
+        # Snapshot when the render starts so a queued render shows the latest data
+        data = sim_tracker.snapshot() if sim_tracker is not None else None
+        generate_dashboard(output_dir=data_dir, data=data)
+    except Exception as e:
+        print_error(f"Error generating dashboard: {e}")
+
 def handle_market_update(bot, interval=config.CHECK_INTERVAL, symbol_prefix=""):
     """
     Handle regular market updates and trade execution with high frequency updates
@@ -33,38 +63,43 @@ def handle_market_update(bot, interval=config.CHECK_INTERVAL, symbol_prefix=""):
     print_info(f"{symbol_prefix}Using ultra-short moving averages ({bot.short_window}/{bot.long_window})")
     print_info(f"{symbol_prefix}Timeframe: {bot.timeframe}")
     
+    # Ticks are scheduled against a monotonic deadline so wall clock
+    # adjustments cannot stretch or shrink the update cadence
+    interval_ns = int(interval * 1_000_000_000)
+    deadline = time.monotonic_ns()
+    
     while True:
         try:
-            start_time = time.time()
-            
             # Fetch the latest market data
             df = bot.analyze_market(limit=30)  # Reduced limit for faster processing
             
             if df is None or len(df) == 0:
                 print_warning(f"{symbol_prefix}Could not fetch market data. Retrying...")
                 time.sleep(interval)
+                deadline = time.monotonic_ns()
                 continue
             
             # Get the current price
-            current_price = df.iloc[-1]['close']
+            current_price = df['close'].iat[-1]
             
-            # Always display balance info with each update
-            if bot.in_simulation_mode and bot.sim_tracker:
-                balance = bot.sim_tracker.get_current_balance(current_price)
-                base_currency = bot.symbol.split('/')[0]
-                quote_currency = bot.symbol.split('/')[1]
-                
-                print_header(f"{symbol_prefix}BALANCE UPDATE ({datetime.now().strftime('%H:%M:%S')})")
-                print_info(f"{symbol_prefix}Balance: {balance['quote_balance']:.2f} {quote_currency} | "
-                         f"{balance['base_balance']:.6f} {base_currency}")
+            # Collect the tick's status display and write it to stdout in one go
+            with buffered_output():
+                # Display balance info with each update unless routine output is hidden
+                if info_enabled() and bot.in_simulation_mode and bot.sim_tracker:
+                    balance = bot.sim_tracker.get_current_balance(current_price)
+                    quote_currency = bot.quote_currency
+                    
+                    print_header(f"{symbol_prefix}BALANCE UPDATE ({datetime.now().strftime('%H:%M:%S')})")
+                    print_info(f"{symbol_prefix}Balance: {balance['quote_balance']:.2f} {quote_currency} | "
+                             f"{balance['base_balance']:.6f} {bot.base_currency}")
+                    
+                    if 'profit_loss' in balance and 'profit_loss_pct' in balance:
+                        profit_formatted = format_profit(balance['profit_loss'])
+                        pct_formatted = format_percentage(balance['profit_loss_pct'])
+                        print_info(f"{symbol_prefix}P/L: {profit_formatted} {quote_currency} ({pct_formatted})")
                 
-                if 'profit_loss' in balance and 'profit_loss_pct' in balance:
-                    profit_formatted = format_profit(balance['profit_loss'])
-                    pct_formatted = format_percentage(balance['profit_loss_pct'])
-                    print_info(f"{symbol_prefix}P/L: {profit_formatted} {quote_currency} ({pct_formatted})")
-            
-            # Display market information
-            display_market_info(bot, df, current_price, symbol_prefix)
+                # Display market information
+                display_market_info(bot, df, current_price, symbol_prefix)
             
             # Process trading signals
             process_signals(bot, df, current_price, symbol_prefix)
@@ -77,26 +112,34 @@ def handle_market_update(bot, interval=config.CHECK_INTERVAL, symbol_prefix=""):
                 if counter % config.UPDATE_DISPLAY_INTERVAL == 0:
                     log_simulation_state(bot, current_price, symbol_prefix=symbol_prefix)
                 
-                # Generate dashboard periodically
+                # Generate dashboard periodically without blocking the update loop,
+                # rendering the tracker's in-memory history instead of re-reading
+                # the JSON file it has just written
                 if counter % config.GENERATE_DASHBOARD_INTERVAL == 0:
-                    generate_dashboard(output_dir=bot.data_dir)
+                    request_dashboard(bot.data_dir, bot.sim_tracker)
             
             # Increment counter
             counter += 1
             
-            # Calculate time taken for this update
-            elapsed = time.time() - start_time
+            # Schedule the next tick; if this one overran, start again from now
+            # instead of firing a burst of catch-up updates
+            deadline += interval_ns
+            sleep_ns = deadline - time.monotonic_ns()
+            if sleep_ns <= 0:
+                deadline -= sleep_ns
+                sleep_ns = 0
             
             # Print separator for next update
-            wait_time = max(0.1, interval - elapsed)  # Ensure we wait at least 0.1 seconds
-            print_info(f"{symbol_prefix}Next update in {wait_time:.1f} seconds...")
+            print_info(f"{symbol_prefix}Next update in {sleep_ns / 1e9:.1f} seconds...")
             print_info(f"{symbol_prefix}{'=' * 80}")
             
             # Sleep until next update
-            time.sleep(wait_time)
+            if sleep_ns > 0:
+                time.sleep(sleep_ns / 1e9)
             
         except Exception as e:
             print_error(f"{symbol_prefix}Error during market update: {e}")
             import traceback
             traceback.print_exc()
-            time.sleep(interval)
\ No newline at end of file
+            time.sleep(interval)
+            deadline = time.monotonic_ns()
\ No newline at end of file
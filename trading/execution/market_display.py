@@ -3,9 +3,8 @@ Market display module for the trading bot.
 Handles displaying market information and technical indicators for high frequency trading.
 """
 
-from datetime import datetime
 from utils.terminal_colors import (
-    print_info, print_price, Colors
+    print_info, print_price, info_enabled, clock_timestamp, Colors
 )
 from trading.execution.position_management import display_position_info
 from trading.market_analysis import extract_high_frequency_indicators
@@ -23,14 +22,18 @@ def display_market_info(bot, df, current_price, symbol_prefix=""):
     if df is None or len(df) == 0 or current_price is None:
         return
     
+    # Skip building the display strings entirely when they would not be printed
+    if not info_enabled():
+        return
+    
     # Get the current timestamp for high frequency display
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    timestamp = clock_timestamp()
     
     # Extract high frequency indicators
     indicators = extract_high_frequency_indicators(df)
     
     # Print timestamp and price information
-    print_price(f"{symbol_prefix}[{timestamp}] Current price: ${float(current_price):,.2f}")
+    print_price(f"{symbol_prefix}[{timestamp}] Current price: ${current_price:,.2f}")
     
     # Show price change since last update if available
     if 'price_change_pct' in indicators:
@@ -5,10 +5,10 @@ Handles entry price tracking and risk management.
 
 from utils.terminal_colors import (
     print_success, print_error, print_warning, print_info, 
-    print_buy, print_sell, print_simulation, format_profit, format_percentage, Colors
+    print_buy, print_sell, print_simulation, format_profit, format_percentage, Colors,
+    info_enabled
 )
-from trading.order import execute_trade
-from trading.execution.simulation_reporting import log_simulation_state, log_simulation_trade_detail
+from trading.execution.simulation_reporting import log_simulation_trade
 
 def update_position_entry_prices(bot, sell_amount):
     """
@@ -18,25 +18,24 @@ def update_position_entry_prices(bot, sell_amount):
     bot (CryptoTradingBot): Bot instance
     sell_amount (float): Amount sold
     """
+    positions = bot.position_entry_prices
     remaining_to_sell = sell_amount
-    new_entry_prices = []
-    
-    # Loop through positions, starting from oldest (FIFO approach)
-    for position_amount, entry_price in bot.position_entry_prices:
-        if remaining_to_sell <= 0:
-            # No more to sell, keep this position
-            new_entry_prices.append((position_amount, entry_price))
-        elif remaining_to_sell >= position_amount:
-            # Sell entire position
-            remaining_to_sell -= position_amount
-        else:
-            # Sell part of position
-            new_amount = position_amount - remaining_to_sell
-            new_entry_prices.append((new_amount, entry_price))
-            remaining_to_sell = 0
-    
-    # Update the list of entry prices
-    bot.position_entry_prices = new_entry_prices
+    fully_sold = 0
+    
+    # Walk positions from oldest (FIFO approach) only as far as the sell reaches
+    for position_amount, _ in positions:
+        if remaining_to_sell <= 0 or remaining_to_sell < position_amount:
+            break
+        remaining_to_sell -= position_amount
+        fully_sold += 1
+    
+    # Drop the fully sold positions in place; everything after them is untouched
+    del positions[:fully_sold]
+    
+    # Sell part of the oldest remaining position
+    if remaining_to_sell > 0 and positions:
+        position_amount, entry_price = positions[0]
+        positions[0] = (position_amount - remaining_to_sell, entry_price)
 
 def handle_risk_management(bot, current_price, symbol_prefix=""):
     """
@@ -56,6 +55,10 @@ def handle_risk_management(bot, current_price, symbol_prefix=""):
     action_taken = False
     positions_to_close = []
     
+    # Read the thresholds once rather than per position
+    take_profit_pct = bot.take_profit_percentage
+    stop_loss_pct = -bot.stop_loss_percentage
+    
     # Check each position individually for take profit/stop loss
     for i, (position_amount, entry_price) in enumerate(bot.position_entry_prices):
         # Skip positions with zero entry price (recovered from existing simulation)
@@ -65,40 +68,36 @@ def handle_risk_management(bot, current_price, symbol_prefix=""):
         price_change_pct = ((current_price - entry_price) / entry_price) * 100
         
         # Take profit
-        if price_change_pct >= bot.take_profit_percentage:
+        if price_change_pct >= take_profit_pct:
             print_sell(f"{symbol_prefix}TAKE PROFIT triggered for position {i+1} at ${current_price:.2f} ({price_change_pct:.2f}%)")
             positions_to_close.append(i)
             action_taken = True
         
         # Stop loss
-        elif price_change_pct <= -bot.stop_loss_percentage:
+        elif price_change_pct <= stop_loss_pct:
             print_sell(f"{symbol_prefix}STOP LOSS triggered for position {i+1} at ${current_price:.2f} ({price_change_pct:.2f}%)")
             positions_to_close.append(i)
             action_taken = True
     
     # Close positions that hit TP/SL (starting from the end to avoid index shifts)
-    for i in sorted(positions_to_close, reverse=True):
+    execute = bot.trade_executor
+    closed_any = False
+    for i in reversed(positions_to_close):
         position_amount = bot.position_entry_prices[i][0]
         
-        if bot.in_simulation_mode and bot.sim_tracker:
-            # Execute simulated sell for take profit/stop loss
-            if bot.sim_tracker.execute_trade('sell', position_amount, current_price):
-                print_success(f"{symbol_prefix}Closed position of {position_amount} at ${current_price:.2f}")
-                bot.current_position_size -= position_amount
-                bot.position_entry_prices.pop(i)
-                
-                # Log detailed simulation information for risk management trades
-                log_simulation_trade_detail(bot, 'sell', position_amount, current_price, current_price, symbol_prefix)
-                log_simulation_state(bot, current_price, 'sell', position_amount, current_price, symbol_prefix)
-                
-                # Generate and save performance chart
-                bot.sim_tracker.plot_performance()
-        elif not bot.in_simulation_mode:
-            # Execute real sell for take profit/stop loss
-            if execute_trade('sell', bot.base_url, bot.api_key, bot.symbol, position_amount):
-                print_success(f"{symbol_prefix}Closed position of {position_amount} at ${current_price:.2f}")
-                bot.current_position_size -= position_amount
-                bot.position_entry_prices.pop(i)
+        # Execute sell for take profit/stop loss (simulated or real, chosen at bot init)
+        if execute('sell', position_amount, current_price):
+            print_success(f"{symbol_prefix}Closed position of {position_amount} at ${current_price:.2f}")
+            bot.current_position_size -= position_amount
+            bot.position_entry_prices.pop(i)
+            
+            # Log detailed simulation information for risk management trades
+            log_simulation_trade(bot, 'sell', position_amount, current_price, current_price, symbol_prefix)
+            closed_any = True
+    
+    # Render the performance chart once for all positions closed this tick, off the trading loop
+    if closed_any and bot.sim_tracker:
+        bot.sim_tracker.request_performance_plot()
     
     return action_taken
 
@@ -111,11 +110,14 @@ def display_position_info(bot, current_price, symbol_prefix=""):
     current_price (float): Current market price
     symbol_prefix (str): Prefix to use in log messages
     """
+    if not info_enabled():
+        return
+    
     if bot.current_position_size <= 0:
         print_info(f"{symbol_prefix}No active positions")
         return
     
-    print_info(f"{symbol_prefix}Current position size: {bot.current_position_size} {bot.symbol.split('/')[0]}")
+    print_info(f"{symbol_prefix}Current position size: {bot.current_position_size} {bot.base_currency}")
     print_info(f"{symbol_prefix}Position utilization: {bot.current_position_size / (bot.max_position_size * bot.base_position_size) * 100:.2f}%")
     
     total_invested = 0
@@ -178,7 +180,9 @@ def handle_high_frequency_risk_management(bot, current_price, df, symbol_prefix=
     # Check for micro-trend reversal
     if len(df) >= 3:
         # Check for a short-term downtrend when we have a position
-        micro_downtrend = (df['close'].iloc[-1] < df['close'].iloc[-2]) and (df['close'].iloc[-2] < df['close'].iloc[-3])
+        # Compare the last three closes as plain floats instead of indexing the Series three times
+        close_3, close_2, close_1 = df['close'].to_numpy()[-3:].tolist()
+        micro_downtrend = close_1 < close_2 < close_3
         
         # If we have a downtrend and a position, consider closing part of it
         if micro_downtrend:
@@ -209,28 +213,26 @@ def handle_high_frequency_risk_management(bot, current_price, df, symbol_prefix=
             positions_to_close.append(i)
             action_taken = True
     
-    # Close positions that hit TP/SL (starting from the end to avoid index shifts)
-    for i in sorted(positions_to_close, reverse=True):
+    # Close positions that hit TP/SL (starting from the end to avoid index shifts).
+    # The oldest position can be flagged by both the micro-trend check and its
+    # own TP/SL; close it once, otherwise the second pop would sell the next lot
+    execute = bot.trade_executor
+    closed_any = False
+    for i in sorted(set(positions_to_close), reverse=True):
         position_amount = bot.position_entry_prices[i][0]
         
-        if bot.in_simulation_mode and bot.sim_tracker:
-            # Execute simulated sell for take profit/stop loss
-            if bot.sim_tracker.execute_trade('sell', position_amount, current_price):
-                print_success(f"{symbol_prefix}Closed position of {position_amount} at ${current_price:.2f}")
-                bot.current_position_size -= position_amount
-                bot.position_entry_prices.pop(i)
-                
-                # Log detailed simulation information for risk management trades
-                log_simulation_trade_detail(bot, 'sell', position_amount, current_price, current_price, symbol_prefix)
-                log_simulation_state(bot, current_price, 'sell', position_amount, current_price, symbol_prefix)
-                
-                # Generate and save performance chart
-                bot.sim_tracker.plot_performance()
-        elif not bot.in_simulation_mode:
-            # Execute real sell for take profit/stop loss
-            if execute_trade('sell', bot.base_url, bot.api_key, bot.symbol, position_amount):
-                print_success(f"{symbol_prefix}Closed position of {position_amount} at ${current_price:.2f}")
-                bot.current_position_size -= position_amount
-                bot.position_entry_prices.pop(i)
+        # Execute sell for take profit/stop loss (simulated or real, chosen at bot init)
+        if execute('sell', position_amount, current_price):
+            print_success(f"{symbol_prefix}Closed position of {position_amount} at ${current_price:.2f}")
+            bot.current_position_size -= position_amount
+            bot.position_entry_prices.pop(i)
+            
+            # Log detailed simulation information for risk management trades
+            log_simulation_trade(bot, 'sell', position_amount, current_price, current_price, symbol_prefix)
+            closed_any = True
+    
+    # Render the performance chart once for all positions closed this tick, off the trading loop
+    if closed_any and bot.sim_tracker:
+        bot.sim_tracker.request_performance_plot()
     
     return action_taken
\ No newline at end of file
@@ -11,6 +11,12 @@ from utils.terminal_colors import (
     format_profit, format_percentage, Colors
 )
 
+# Indicator columns read from the latest candle when scoring a signal
+SIGNAL_STRENGTH_COLUMNS = (
+    'short_ma', 'long_ma', 'ema3', 'ema8', 'fast_rsi', 'stoch_k', 'stoch_d',
+    'rsi', 'macd', 'macd_signal', 'close', 'bb_lower', 'bb_upper'
+)
+
 def calculate_signal_strength(df, use_enhanced_strategy=True, use_scalping_strategy=False):
     """
     Calculate the strength of a trading signal on a scale of 0.0 to 1.0
@@ -26,7 +32,10 @@ def calculate_signal_strength(df, use_enhanced_strategy=True, use_scalping_strat
     if df is None or len(df) < 2:
         return 0.0
     
-    latest = df.iloc[-1]
+    # Read only the cells used below instead of building the whole last row
+    # as a Series; every lookup after this is a plain dict access
+    columns = df.columns
+    latest = {column: df[column].iat[-1] for column in SIGNAL_STRENGTH_COLUMNS if column in columns}
     strength_components = []
     
     # Common strength components
@@ -93,7 +102,8 @@ def calculate_signal_strength(df, use_enhanced_strategy=True, use_scalping_strat
     if strength_components:
         # Weight recent price action more heavily
         if len(df) >= 3:
-            price_momentum = 1.0 if df.iloc[-1]['close'] > df.iloc[-2]['close'] else 0.0
+            close = df['close']
+            price_momentum = 1.0 if close.iat[-1] > close.iat[-2] else 0.0
             strength_components.append(price_momentum)
         
         # Average all components
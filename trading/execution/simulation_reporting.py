@@ -3,10 +3,11 @@ Enhanced simulation reporting module for the trading bot.
 Handles detailed logging of simulation state for high frequency trading.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from utils.terminal_colors import (
     print_simulation, print_success, print_info, 
-    format_profit, format_percentage, Colors
+    format_profit, format_percentage, Colors, buffered_output, info_enabled,
+    clock_timestamp
 )
 
 def log_simulation_state(bot, current_price, action=None, amount=None, price=None, symbol_prefix=""):
@@ -23,14 +24,18 @@ def log_simulation_state(bot, current_price, action=None, amount=None, price=Non
     """
     if not bot.in_simulation_mode or not bot.sim_tracker:
         return
+    
+    # Periodic balance updates are routine output; trade logs are always shown
+    if not action and not info_enabled():
+        return
         
     # Get current balance information
     balance = bot.sim_tracker.get_current_balance(current_price)
-    base_currency = bot.symbol.split('/')[0]
-    quote_currency = bot.symbol.split('/')[1]
+    base_currency = bot.base_currency
+    quote_currency = bot.quote_currency
     
     # Get current timestamp for high-frequency display
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    timestamp = clock_timestamp()
     
     # Print action header if this is after a trade
     if action and amount and price:
@@ -59,17 +64,22 @@ def log_simulation_state(bot, current_price, action=None, amount=None, price=Non
     
     # Print trade counts if available
     if hasattr(bot.sim_tracker, 'transaction_history'):
-        trade_count = len(bot.sim_tracker.transaction_history)
-        buy_count = sum(1 for t in bot.sim_tracker.transaction_history if t['action'] == 'buy')
-        sell_count = sum(1 for t in bot.sim_tracker.transaction_history if t['action'] == 'sell')
+        transaction_history = bot.sim_tracker.transaction_history
+        trade_count = len(transaction_history)
+        buy_count, sell_count = bot.sim_tracker.get_trade_counts()
         
         # For high frequency trading, show recent trade rate
         recent_trades = 0
         if trade_count > 0:
-            # Count trades in the last minute
-            now = datetime.now()
-            recent_trades = sum(1 for t in bot.sim_tracker.transaction_history 
-                              if (now - datetime.fromisoformat(t['timestamp'])).total_seconds() < 60)
+            # Count trades in the last minute. Transactions are recorded in time
+            # order, so walk back from the newest and stop at the first older one.
+            # Naive ISO-8601 timestamps sort chronologically as strings, so they
+            # are compared against the cutoff without being parsed
+            cutoff = (datetime.now() - timedelta(seconds=60)).isoformat()
+            for t in reversed(transaction_history):
+                if t['timestamp'] <= cutoff:
+                    break
+                recent_trades += 1
         
         print_simulation(f"{symbol_prefix}Trades: {trade_count} total | {recent_trades}/min rate | {buy_count} buys | {sell_count} sells")
 
@@ -88,9 +98,9 @@ def log_simulation_trade_detail(bot, action, amount, price, current_price, symbo
     if not bot.in_simulation_mode or not bot.sim_tracker:
         return
     
-    base_currency = bot.symbol.split('/')[0]
-    quote_currency = bot.symbol.split('/')[1]
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    base_currency = bot.base_currency
+    quote_currency = bot.quote_currency
+    timestamp = clock_timestamp()
     
     if action.lower() == 'buy':
         cost = amount * price * 1.001  # Including 0.1% fee
@@ -125,4 +135,24 @@ def log_simulation_trade_detail(bot, action, amount, price, current_price, symbo
         
         # Print remaining position
         print_simulation(f"{symbol_prefix}Remaining: {bot.current_position_size} {base_currency} "
-                       f"({bot.current_position_size / (bot.max_position_size * bot.base_position_size) * 100:.1f}% of max)")
\ No newline at end of file
+                       f"({bot.current_position_size / (bot.max_position_size * bot.base_position_size) * 100:.1f}% of max)")
+
+def log_simulation_trade(bot, action, amount, price, current_price, symbol_prefix=""):
+    """
+    Log a simulation trade: the trade detail followed by the resulting state,
+    written to stdout in a single call
+
+    Parameters:
+    bot (CryptoTradingBot): Bot instance
+    action (str): Trade action ('buy' or 'sell')
+    amount (float): Amount traded
+    price (float): Price at which the trade occurred
+    current_price (float): Current market price
+    symbol_prefix (str): Prefix to use in log messages
+    """
+    if not bot.in_simulation_mode or not bot.sim_tracker:
+        return
+    
+    with buffered_output():
+        log_simulation_trade_detail(bot, action, amount, price, current_price, symbol_prefix)
+        log_simulation_state(bot, current_price, action, amount, price, symbol_prefix)
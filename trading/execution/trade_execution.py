@@ -3,15 +3,14 @@ Trade execution module for the trading bot.
 Handles signal processing and order execution for high frequency trading.
 """
 
-from datetime import datetime
-from trading.order import execute_trade
 from trading.market_analysis import get_signal_info, get_high_frequency_signal
 from trading.execution.signal_processing import calculate_signal_strength, calculate_position_increment, calculate_sell_amount
 from trading.execution.position_management import update_position_entry_prices, handle_risk_management, handle_high_frequency_risk_management
-from trading.execution.simulation_reporting import log_simulation_state, log_simulation_trade_detail
+from trading.execution.simulation_reporting import log_simulation_trade
 from utils.terminal_colors import (
     print_success, print_error, print_warning, print_info, 
-    print_buy, print_sell, print_price, print_simulation, Colors
+    print_buy, print_sell, print_price, print_simulation, Colors,
+    clock_timestamp
 )
 
 def process_signals(bot, df, current_price, symbol_prefix=""):
@@ -53,41 +52,36 @@ def process_signals(bot, df, current_price, symbol_prefix=""):
     
     # Check for buy signal
     if position_change == 1:
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        timestamp = clock_timestamp()
         print_buy(f"{symbol_prefix}BUY SIGNAL at {timestamp} - Price: ${current_price:.2f}")
         
         # Calculate position increment based on signal strength
         increment_size = calculate_position_increment(bot, signal_strength)
         
         # Check if we can add to our position
-        if bot.current_position_size < bot.max_position_size * bot.base_position_size:
+        base_position_size = bot.base_position_size
+        max_position_amount = bot.max_position_size * base_position_size
+        if bot.current_position_size < max_position_amount:
             # Determine the amount to buy for this increment
             buy_amount = min(
-                bot.base_position_size * increment_size,
-                (bot.max_position_size * bot.base_position_size) - bot.current_position_size
+                base_position_size * increment_size,
+                max_position_amount - bot.current_position_size
             )
             
             # Only execute if the buy amount is significant
-            if buy_amount >= bot.base_position_size * 0.1:  # Min 10% of base size
-                if bot.in_simulation_mode and bot.sim_tracker:
-                    # Execute simulated trade
-                    if bot.sim_tracker.execute_trade('buy', buy_amount, current_price):
-                        bot.current_position_size += buy_amount
-                        bot.position_entry_prices.append((buy_amount, current_price))
-                        print_success(f"{symbol_prefix}Added {buy_amount} to position at ${current_price:.2f}. Current size: {bot.current_position_size}")
-                        
-                        # Log detailed simulation information
-                        log_simulation_trade_detail(bot, 'buy', buy_amount, current_price, current_price, symbol_prefix)
-                        log_simulation_state(bot, current_price, 'buy', buy_amount, current_price, symbol_prefix)
-                        
-                        # Generate and save performance chart
-                        bot.sim_tracker.plot_performance()
-                elif not bot.in_simulation_mode:
-                    # Execute real trade
-                    if execute_trade('buy', bot.base_url, bot.api_key, bot.symbol, buy_amount):
-                        bot.current_position_size += buy_amount
-                        bot.position_entry_prices.append((buy_amount, current_price))
-                        print_success(f"{symbol_prefix}Added {buy_amount} to position at ${current_price:.2f}. Current size: {bot.current_position_size}")
+            if buy_amount >= base_position_size * 0.1:  # Min 10% of base size
+                # Execute trade (simulated or real, chosen at bot init)
+                if bot.trade_executor('buy', buy_amount, current_price):
+                    bot.current_position_size += buy_amount
+                    bot.position_entry_prices.append((buy_amount, current_price))
+                    print_success(f"{symbol_prefix}Added {buy_amount} to position at ${current_price:.2f}. Current size: {bot.current_position_size}")
+                    
+                    # Log detailed simulation information
+                    log_simulation_trade(bot, 'buy', buy_amount, current_price, current_price, symbol_prefix)
+                    
+                    # Render the performance chart off the trading loop
+                    if bot.sim_tracker:
+                        bot.sim_tracker.request_performance_plot()
             else:
                 print_warning(f"{symbol_prefix}Buy amount {buy_amount} too small - skipping")
         else:
@@ -96,34 +90,26 @@ def process_signals(bot, df, current_price, symbol_prefix=""):
     
     # Check for sell signal
     elif position_change == -1:
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        timestamp = clock_timestamp()
         print_sell(f"{symbol_prefix}SELL SIGNAL at {timestamp} - Price: ${current_price:.2f}")
         
         if bot.current_position_size > 0:
             # For high frequency trading, be more aggressive with sells
             sell_amount = min(bot.current_position_size, bot.base_position_size)
             
-            if bot.in_simulation_mode and bot.sim_tracker:
-                # Execute simulated trade
-                if bot.sim_tracker.execute_trade('sell', sell_amount, current_price):
-                    bot.current_position_size -= sell_amount
-                    # Update entry prices list (remove oldest entries first)
-                    update_position_entry_prices(bot, sell_amount)
-                    print_success(f"{symbol_prefix}Sold {sell_amount} at ${current_price:.2f}. Remaining position: {bot.current_position_size}")
-                    
-                    # Log detailed simulation information
-                    log_simulation_trade_detail(bot, 'sell', sell_amount, current_price, current_price, symbol_prefix)
-                    log_simulation_state(bot, current_price, 'sell', sell_amount, current_price, symbol_prefix)
-                    
-                    # Generate and save performance chart
-                    bot.sim_tracker.plot_performance()
-            elif not bot.in_simulation_mode:
-                # Execute real trade
-                if execute_trade('sell', bot.base_url, bot.api_key, bot.symbol, sell_amount):
-                    bot.current_position_size -= sell_amount
-                    # Update entry prices list
-                    update_position_entry_prices(bot, sell_amount)
-                    print_success(f"{symbol_prefix}Sold {sell_amount} at ${current_price:.2f}. Remaining position: {bot.current_position_size}")
+            # Execute trade (simulated or real, chosen at bot init)
+            if bot.trade_executor('sell', sell_amount, current_price):
+                bot.current_position_size -= sell_amount
+                # Update entry prices list (remove oldest entries first)
+                update_position_entry_prices(bot, sell_amount)
+                print_success(f"{symbol_prefix}Sold {sell_amount} at ${current_price:.2f}. Remaining position: {bot.current_position_size}")
+                
+                # Log detailed simulation information
+                log_simulation_trade(bot, 'sell', sell_amount, current_price, current_price, symbol_prefix)
+                
+                # Render the performance chart off the trading loop
+                if bot.sim_tracker:
+                    bot.sim_tracker.request_performance_plot()
         else:
             print_warning(f"{symbol_prefix}No position to sell")
         return True
@@ -3,6 +3,8 @@ Market analysis module for the trading bot.
 Handles fetching and analyzing market data for high frequency trading.
 """
 
+import threading
+
 from utils.data_utils import prepare_ohlcv_dataframe, calculate_moving_averages
 from trading.strategies import calculate_ma_crossover_signals, calculate_enhanced_signals, calculate_scalping_signals, get_latest_signal, get_latest_scalping_signal, calculate_high_frequency_signals, get_high_frequency_signal
 
@@ -11,6 +13,53 @@ from utils.terminal_colors import (
     print_buy, print_sell, print_price, print_header, Colors
 )
 
+# Raw candles from the previous fetch, keyed by exchange, symbol, timeframe and
+# limit, so each tick only has to download the newest bars
+_candle_cache = {}
+_candle_cache_lock = threading.Lock()
+
+# Bars refetched per tick: the candle still forming plus the last closed one
+_TAIL_CANDLES = 2
+
+def _fetch_ohlcv_rows(exchange, symbol, timeframe, limit):
+    """
+    Fetch the latest `limit` candles, reusing closed candles from the previous call
+    
+    Only the last few bars are requested when they overlap the cached window;
+    otherwise (first call, or a gap after a stall) the full window is fetched
+    
+    Parameters:
+    exchange (ccxt.Exchange): Exchange instance
+    symbol (str): The trading pair (e.g., 'BTC/USDT')
+    timeframe (str): Exchange timeframe (e.g., '1m')
+    limit (int): Number of candles to return
+    
+    Returns:
+    list: OHLCV rows, oldest first
+    """
+    key = (getattr(exchange, 'id', None), symbol, timeframe, limit)
+    with _candle_cache_lock:
+        cached = _candle_cache.get(key)
+    
+    rows = None
+    if cached and limit > _TAIL_CANDLES:
+        tail = exchange.fetch_ohlcv(symbol, timeframe, limit=_TAIL_CANDLES)
+        # The tail must start inside the cached window, otherwise bars were missed
+        if tail and cached[0][0] <= tail[0][0] <= cached[-1][0]:
+            first_new = tail[0][0]
+            rows = [row for row in cached if row[0] < first_new]
+            rows.extend(tail)
+            rows = rows[-limit:]
+    
+    if rows is None:
+        rows = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+    
+    if rows:
+        with _candle_cache_lock:
+            _candle_cache[key] = rows
+    
+    return rows
+
 @staticmethod
 def fetch_ohlcv_data(exchange, symbol, timeframe, limit=30):
     """
@@ -37,7 +86,7 @@ def fetch_ohlcv_data(exchange, symbol, timeframe, limit=30):
             binance_timeframe = '1m'
         
         # Fetch OHLCV data using CCXT (no authentication needed)
-        ohlcv = exchange.fetch_ohlcv(clean_symbol, binance_timeframe, limit=limit)
+        ohlcv = _fetch_ohlcv_rows(exchange, clean_symbol, binance_timeframe, limit)
         
         # Convert to DataFrame
         df = prepare_ohlcv_dataframe(ohlcv)
@@ -104,8 +153,8 @@ def get_current_price(df):
     if df is None or len(df) == 0:
         return None
     
-    # Ensure we return a float
-    return float(df.iloc[-1]['close'])
+    # Ensure we return a float, reading the cell rather than the whole last row
+    return float(df['close'].iat[-1])
 
 def get_signal_info(df, use_enhanced_strategy=True, use_scalping_strategy=False):
     """
@@ -143,35 +192,40 @@ def extract_high_frequency_indicators(df):
     if df is None or len(df) == 0:
         return {}
     
-    latest = df.iloc[-1]
+    columns = df.columns
+    
+    def latest(column):
+        # Read single cells instead of materialising the whole last row as a Series
+        return df[column].iat[-1] if column in columns else None
+    
     indicators = {}
     
     # Common indicators
-    indicators['current_price'] = latest.get('close')
+    indicators['current_price'] = latest('close')
     
     # High frequency indicators
-    indicators['ema1'] = latest.get('ema1')
-    indicators['ema2'] = latest.get('ema2')
-    indicators['ema3'] = latest.get('ema3')
-    indicators['ema5'] = latest.get('ema5')
-    indicators['fast_rsi'] = latest.get('fast_rsi')
-    indicators['stoch_k'] = latest.get('stoch_k')
-    indicators['stoch_d'] = latest.get('stoch_d')
+    indicators['ema1'] = latest('ema1')
+    indicators['ema2'] = latest('ema2')
+    indicators['ema3'] = latest('ema3')
+    indicators['ema5'] = latest('ema5')
+    indicators['fast_rsi'] = latest('fast_rsi')
+    indicators['stoch_k'] = latest('stoch_k')
+    indicators['stoch_d'] = latest('stoch_d')
     
     # Bollinger Bands
-    if 'bb_lower' in df.columns and 'bb_upper' in df.columns:
-        indicators['bb_lower'] = latest.get('bb_lower')
-        indicators['bb_upper'] = latest.get('bb_upper')
-        indicators['bb_middle'] = latest.get('bb_middle')
+    if 'bb_lower' in columns and 'bb_upper' in columns:
+        indicators['bb_lower'] = latest('bb_lower')
+        indicators['bb_upper'] = latest('bb_upper')
+        indicators['bb_middle'] = latest('bb_middle')
         
         # Add BB width as volatility indicator
-        if 'bb_width' in df.columns:
-            indicators['bb_width'] = latest.get('bb_width')
+        if 'bb_width' in columns:
+            indicators['bb_width'] = latest('bb_width')
             
     # Add price change percentage from previous candle
-    if len(df) > 1:
-        prev_price = df.iloc[-2].get('close')
+    if len(df) > 1 and 'close' in columns:
+        prev_price = df['close'].iat[-2]
         if prev_price and prev_price > 0:
-            indicators['price_change_pct'] = (latest.get('close') / prev_price - 1) * 100
+            indicators['price_change_pct'] = (indicators['current_price'] / prev_price - 1) * 100
     
     return indicators
\ No newline at end of file
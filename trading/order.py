@@ -30,8 +30,7 @@ def check_balance(base_url, api_key, symbol):
             'locked': float(asset['locked'])
         } for asset in response['balances']}
         
-        base_currency = symbol.split('/')[0]
-        quote_currency = symbol.split('/')[1]
+        base_currency, quote_currency = symbol.split('/')
         
         base_balance = balances.get(base_currency, {'free': 0})['free']
         quote_balance = balances.get(quote_currency, {'free': 0})['free']
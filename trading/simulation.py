@@ -4,10 +4,10 @@ Tracks balance and performance in simulation mode.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime
-import json
 import os
+from utils.json_utils import load_json_file, save_json_file
+from utils.background import submit_background
 from utils.terminal_colors import (
     print_success, print_error, print_warning, print_info, 
     print_buy, print_sell, print_simulation, Colors
@@ -29,6 +29,13 @@ class SimulationTracker:
         self.base_currency = base_currency
         self.quote_currency = quote_currency
         self.transaction_history = []
+        
+        # Running buy/sell counts over transaction_history, see get_trade_counts()
+        self._counted_history = None
+        self._counted_transactions = 0
+        self._buy_count = 0
+        self._sell_count = 0
+        
         self.balance_history = [{
             'timestamp': datetime.now().isoformat(),
             'quote_balance': self.quote_balance,
@@ -147,6 +154,32 @@ class SimulationTracker:
         # Save updated data
         self._save_data()
     
+    def get_trade_counts(self):
+        """
+        Count buy and sell transactions, scanning only those recorded since the
+        previous call
+
+        Returns:
+        tuple: (buy_count, sell_count)
+        """
+        history = self.transaction_history
+        
+        # Start over if the history list was replaced (e.g. restored from disk)
+        if history is not self._counted_history:
+            self._counted_history = history
+            self._counted_transactions = 0
+            self._buy_count = 0
+            self._sell_count = 0
+        
+        for transaction in history[self._counted_transactions:]:
+            if transaction['action'] == 'buy':
+                self._buy_count += 1
+            elif transaction['action'] == 'sell':
+                self._sell_count += 1
+        self._counted_transactions = len(history)
+        
+        return self._buy_count, self._sell_count
+    
     def get_current_balance(self, current_price):
         """
         Get the current balance in both currencies and total value
@@ -174,6 +207,22 @@ class SimulationTracker:
             'profit_loss_pct': profit_loss_pct
         }
     
+    def snapshot(self):
+        """
+        Copy the in-memory history for use on another thread
+
+        The lists are copied so later trades and price updates do not change
+        the snapshot; the individual records are never modified after being
+        appended and are shared
+
+        Returns:
+        dict: Simulation data in the same layout as simulation_data.json
+        """
+        return {
+            'transactions': list(self.transaction_history),
+            'balance_history': list(self.balance_history)
+        }
+    
     def _save_data(self):
         """Save simulation data to files"""
         # Convert data to DataFrames
@@ -187,12 +236,16 @@ class SimulationTracker:
         if not balance_df.empty:
             balance_df.to_csv(os.path.join(self.data_dir, 'balance_history.csv'), index=False)
         
-        # Also save as JSON for easier loading
-        with open(os.path.join(self.data_dir, 'simulation_data.json'), 'w') as f:
-            json.dump({
-                'transactions': self.transaction_history,
-                'balance_history': self.balance_history
-            }, f, indent=2)
+        # Also save as JSON for easier loading. Write to a temporary file and
+        # swap it in so dashboards rendered in the background never read a
+        # half-written file
+        data_file = os.path.join(self.data_dir, 'simulation_data.json')
+        temp_file = data_file + '.tmp'
+        save_json_file(temp_file, {
+            'transactions': self.transaction_history,
+            'balance_history': self.balance_history
+        })
+        os.replace(temp_file, data_file)
     
     def generate_performance_report(self, current_price):
         """
@@ -260,7 +313,13 @@ class SimulationTracker:
         Returns:
         str: Path to saved chart or error message
         """
-        if not self.balance_history:
+        # Work on a copy so trades recorded on another thread during the render
+        # do not change the data underneath it
+        data = self.snapshot()
+        balance_history = data['balance_history']
+        transaction_history = data['transactions']
+        
+        if not balance_history:
             return "No data to plot"
         
         # If no save path provided, use the data directory
@@ -268,11 +327,18 @@ class SimulationTracker:
             save_path = os.path.join(self.data_dir, 'performance_chart.png')
         
         # Convert to DataFrame for easier plotting
-        df = pd.DataFrame(self.balance_history)
+        df = pd.DataFrame(balance_history)
         df['timestamp'] = pd.to_datetime(df['timestamp'])
         
-        # Create figure with subplots
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), gridspec_kw={'height_ratios': [3, 1]})
+        # matplotlib is only loaded once a chart is actually drawn
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        # Create figure with subplots; a bare Agg figure bypasses pyplot's
+        # figure manager, so there is nothing to register or close afterwards
+        fig = Figure(figsize=(12, 10))
+        FigureCanvasAgg(fig)
+        ax1, ax2 = fig.subplots(2, 1, gridspec_kw={'height_ratios': [3, 1]})
         
         # Plot total value
         ax1.plot(df['timestamp'], df['total_value_in_quote'], 'b-', label='Total Value')
@@ -290,28 +356,45 @@ class SimulationTracker:
             ax2.legend()
         
         # Add transactions to the chart
-        if self.transaction_history:
-            trans_df = pd.DataFrame(self.transaction_history)
+        if transaction_history:
+            trans_df = pd.DataFrame(transaction_history)
             trans_df['timestamp'] = pd.to_datetime(trans_df['timestamp'])
-            
-            for _, t in trans_df.iterrows():
-                if t['action'] == 'buy':
-                    ax1.scatter(t['timestamp'], t['quote_balance_after'] + t['amount'] * t['price'], 
-                              marker='^', color='g', s=100, alpha=0.7)
-                    if 'price' in df.columns:
-                        ax2.scatter(t['timestamp'], t['price'], marker='^', color='g', s=100, alpha=0.7)
-                else:  # sell
-                    ax1.scatter(t['timestamp'], t['quote_balance_after'], 
-                              marker='v', color='r', s=100, alpha=0.7)
-                    if 'price' in df.columns:
-                        ax2.scatter(t['timestamp'], t['price'], marker='v', color='r', s=100, alpha=0.7)
-        
-        plt.tight_layout()
-        plt.savefig(save_path)
-        plt.close()
+        
+            buys = trans_df[trans_df['action'] == 'buy']
+            sells = trans_df[trans_df['action'] != 'buy']
+        
+            # Draw each action as a single collection instead of one scatter per trade
+            ax1.scatter(buys['timestamp'], buys['quote_balance_after'] + buys['amount'] * buys['price'], 
+                        marker='^', color='g', s=100, alpha=0.7)
+            ax1.scatter(sells['timestamp'], sells['quote_balance_after'], 
+                        marker='v', color='r', s=100, alpha=0.7)
+            if 'price' in df.columns:
+                ax2.scatter(buys['timestamp'], buys['price'], marker='^', color='g', s=100, alpha=0.7)
+                ax2.scatter(sells['timestamp'], sells['price'], marker='v', color='r', s=100, alpha=0.7)
+        
+        fig.tight_layout()
+        fig.savefig(save_path)
         
         print_success(f"Performance chart saved to: {save_path}")
         return save_path
+    
+    def request_performance_plot(self):
+        """
+        Queue plot_performance() on the background thread so trading does not
+        wait for the render; requests made while one is still waiting to start
+        are merged into it
+
+        Returns:
+        bool: True if a new render was queued
+        """
+        return submit_background(('performance', self.data_dir), self._plot_performance_in_background)
+    
+    def _plot_performance_in_background(self):
+        """Run plot_performance(), reporting errors since nothing waits on the result"""
+        try:
+            self.plot_performance()
+        except Exception as e:
+            print_error(f"Error generating performance chart: {e}")
 
 def load_simulation_data(data_dir='simulation_data'):
     """
@@ -331,8 +414,7 @@ def load_simulation_data(data_dir='simulation_data'):
     
     try:
         # Load data from JSON file
-        with open(data_file, 'r') as f:
-            data = json.load(f)
+        data = load_json_file(data_file)
         
         transactions = data.get('transactions', [])
         balance_history = data.get('balance_history', [])
@@ -7,9 +7,9 @@ replacing the JSON file-based approach for better performance and data integrity
 
 import os
 import sqlite3
-import json
 import pandas as pd
 from datetime import datetime
+from utils.json_utils import load_json_file, save_json_file
 from utils.terminal_colors import (
     print_success, print_error, print_warning, print_info
 )
@@ -501,8 +501,7 @@ class SimulationDatabase:
                 target_file = os.path.join(symbol_dir, 'simulation_data.json')
             
             # Write to file
-            with open(target_file, 'w') as f:
-                json.dump(json_data, f, indent=2)
+            save_json_file(target_file, json_data)
                 
             print_success(f"Exported {symbol} data to {target_file}")
             return True
@@ -524,8 +523,7 @@ class SimulationDatabase:
         """
         try:
             # Load JSON data
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+            data = load_json_file(json_file)
             
             # Extract symbol from file path if not provided
             if symbol is None:
@@ -1043,17 +1041,17 @@ class SimulationTracker:
                 trans_df = pd.DataFrame(transactions)
                 trans_df['timestamp'] = pd.to_datetime(trans_df['timestamp'])
                 
-                for _, t in trans_df.iterrows():
-                    if t['action'] == 'buy':
-                        ax1.scatter(t['timestamp'], t['quote_balance_after'] + t['amount'] * t['price'], 
-                                   marker='^', color='g', s=100, alpha=0.7)
-                        if 'price' in df.columns:
-                            ax2.scatter(t['timestamp'], t['price'], marker='^', color='g', s=100, alpha=0.7)
-                    else:  # sell
-                        ax1.scatter(t['timestamp'], t['quote_balance_after'], 
-                                   marker='v', color='r', s=100, alpha=0.7)
-                        if 'price' in df.columns:
-                            ax2.scatter(t['timestamp'], t['price'], marker='v', color='r', s=100, alpha=0.7)
+                buys = trans_df[trans_df['action'] == 'buy']
+                sells = trans_df[trans_df['action'] != 'buy']
+                
+                # Draw each action as a single collection instead of one scatter per trade
+                ax1.scatter(buys['timestamp'], buys['quote_balance_after'] + buys['amount'] * buys['price'], 
+                            marker='^', color='g', s=100, alpha=0.7)
+                ax1.scatter(sells['timestamp'], sells['quote_balance_after'], 
+                            marker='v', color='r', s=100, alpha=0.7)
+                if 'price' in df.columns:
+                    ax2.scatter(buys['timestamp'], buys['price'], marker='^', color='g', s=100, alpha=0.7)
+                    ax2.scatter(sells['timestamp'], sells['price'], marker='v', color='r', s=100, alpha=0.7)
             
             plt.tight_layout()
             plt.savefig(save_path)
@@ -1143,8 +1141,7 @@ def load_simulation_data(data_dir='simulation_data'):
                     return None, False
             
             # Load from JSON
-            with open(data_file, 'r') as f:
-                data = json.load(f)
+            data = load_json_file(data_file)
             
             balance_history = data.get('balance_history', [])
             transactions = data.get('transactions', [])
@@ -318,6 +318,10 @@ def calculate_high_frequency_signals(df, short_window=2, long_window=5):
     
     return df
 
+def _latest_value(df, column, default=None):
+    """Read the last cell of a column without materialising the whole last row"""
+    return df[column].iat[-1] if column in df.columns else default
+
 def get_latest_signal(df, use_enhanced=True):
     """
     Get the latest signal from the DataFrame
@@ -332,18 +336,16 @@ def get_latest_signal(df, use_enhanced=True):
     if df is None or len(df) == 0:
         return None, None, None, None
     
-    latest = df.iloc[-1]
-    
     if use_enhanced and 'enhanced_position_change' in df.columns:
-        position_change = latest.get('enhanced_position_change', 0)
+        position_change = _latest_value(df, 'enhanced_position_change', 0)
     elif 'position_change' in df.columns:
-        position_change = latest.get('position_change', 0)
+        position_change = _latest_value(df, 'position_change', 0)
     else:
         position_change = 0
     
-    current_price = latest.get('close')
-    short_ma = latest.get('short_ma')
-    long_ma = latest.get('long_ma')
+    current_price = _latest_value(df, 'close')
+    short_ma = _latest_value(df, 'short_ma')
+    long_ma = _latest_value(df, 'long_ma')
     
     return position_change, current_price, short_ma, long_ma
 
@@ -360,16 +362,14 @@ def get_latest_scalping_signal(df):
     if df is None or len(df) == 0:
         return None, None, None, None
     
-    latest = df.iloc[-1]
-    
     if 'scalp_position_change' in df.columns:
-        position_change = latest.get('scalp_position_change', 0)
+        position_change = _latest_value(df, 'scalp_position_change', 0)
     else:
         position_change = 0
     
-    current_price = latest.get('close')
-    ema3 = latest.get('ema3')
-    ema8 = latest.get('ema8')
+    current_price = _latest_value(df, 'close')
+    ema3 = _latest_value(df, 'ema3')
+    ema8 = _latest_value(df, 'ema8')
     
     return position_change, current_price, ema3, ema8
 
@@ -386,15 +386,13 @@ def get_high_frequency_signal(df):
     if df is None or len(df) == 0:
         return None, None, None, None
     
-    latest = df.iloc[-1]
-    
     if 'hf_position' in df.columns:
-        position_change = latest.get('hf_position', 0)
+        position_change = _latest_value(df, 'hf_position', 0)
     else:
         position_change = 0
     
-    current_price = latest.get('close')
-    ema1 = latest.get('ema1')
-    ema3 = latest.get('ema3')
+    current_price = _latest_value(df, 'close')
+    ema1 = _latest_value(df, 'ema1')
+    ema3 = _latest_value(df, 'ema3')
     
     return position_change, current_price, ema1, ema3
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Background queue for slow, non-critical work such as chart rendering
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# A single worker keeps chart jobs from running concurrently, so matplotlib is
+# only ever driven from one background thread and the trading loops never wait
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='background')
+_queued = {}
+_queued_lock = threading.Lock()
+
+def submit_background(key, fn, *args, **kwargs):
+    """
+    Queue a job on the background thread unless a job with the same key is
+    still waiting to start
+    
+    A job that is already running does not block a new one, so the latest
+    request is always picked up; jobs should read their data when they run
+    rather than when they are queued
+    
+    Parameters:
+    key (hashable): Identifies jobs that supersede each other
+    fn (callable): Function to run
+    *args, **kwargs: Arguments passed to fn
+    
+    Returns:
+    bool: True if a new job was queued
+    """
+    with _queued_lock:
+        future = _queued.get(key)
+        if future is not None and not future.running() and not future.done():
+            return False
+        
+        _queued[key] = _executor.submit(fn, *args, **kwargs)
+        return True
@@ -0,0 +1,44 @@
+"""
+JSON file helpers that use orjson when it is installed
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+def load_json_file(path):
+    """
+    Load a JSON file, using orjson's faster parser when available
+    
+    Parameters:
+    path (str): Path to the JSON file
+    
+    Returns:
+    The parsed JSON data
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_json_file(path, data):
+    """
+    Write data to a JSON file indented by two spaces, using orjson's faster
+    encoder when available
+    
+    Parameters:
+    path (str): Path to the JSON file
+    data: JSON-serializable data (NumPy scalars are accepted)
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
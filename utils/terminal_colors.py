@@ -2,6 +2,20 @@
 Terminal color utilities for console output formatting
 """
 
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# Info and price lines are hidden at LOG_LEVEL 'warning' and 'error'; the
+# environment sets the default and set_log_level() applies config.LOG_LEVEL
+_INFO_ENABLED = os.getenv('LOG_LEVEL', 'info').lower() not in ('warning', 'error')
+
+# Lines collected by buffered_output(), kept per thread so concurrent bots
+# never capture each other's output
+_output_buffer = threading.local()
+
 class Colors:
     """ANSI color codes for terminal output"""
     HEADER = '\033[95m'
@@ -16,68 +30,120 @@ class Colors:
     UNDERLINE = '\033[4m'
     RESET = '\033[0m'  # Alias for ENDC for compatibility
 
+def _emit(line):
+    """Print a line, or collect it while buffered_output() is active on this thread"""
+    lines = getattr(_output_buffer, 'lines', None)
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line)
+
+@contextmanager
+def buffered_output():
+    """
+    Collect everything the print helpers emit on this thread and write it to
+    stdout in a single call when the block exits
+    
+    Nested blocks share the outermost buffer
+    """
+    if getattr(_output_buffer, 'lines', None) is not None:
+        yield
+        return
+    
+    lines = _output_buffer.lines = []
+    try:
+        yield
+    finally:
+        _output_buffer.lines = None
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+
 def print_header(text):
     """Print bold header text"""
-    print(f"{Colors.HEADER}{Colors.BOLD}{text}{Colors.ENDC}")
+    _emit(f"{Colors.HEADER}{Colors.BOLD}{text}{Colors.ENDC}")
 
 def print_success(text):
     """Print success message in green"""
-    print(f"{Colors.GREEN}✓ {text}{Colors.ENDC}")
+    _emit(f"{Colors.GREEN}✓ {text}{Colors.ENDC}")
 
 def print_error(text):
     """Print error message in red"""
-    print(f"{Colors.RED}✗ {text}{Colors.ENDC}")
+    _emit(f"{Colors.RED}✗ {text}{Colors.ENDC}")
 
 def print_warning(text):
     """Print warning message in yellow"""
-    print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+    _emit(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
+
+def set_log_level(level):
+    """
+    Set the output verbosity
+    
+    Parameters:
+    level (str): 'info' prints everything, 'warning' or 'error' hide info and price lines
+    """
+    global _INFO_ENABLED
+    _INFO_ENABLED = level.lower() not in ('warning', 'error')
+
+def info_enabled():
+    """Return True if print_info and print_price output is shown at the current LOG_LEVEL"""
+    return _INFO_ENABLED
+
+def clock_timestamp():
+    """Current local time as HH:MM:SS.mmm for log lines"""
+    # isoformat() is a C fast path, about twice as quick as strftime('%f')[:-3]
+    return datetime.now().isoformat(timespec='milliseconds')[11:]
 
 def print_info(text):
     """Print info message in blue"""
-    print(f"{Colors.BLUE}ℹ {text}{Colors.ENDC}")
+    if not _INFO_ENABLED:
+        return
+    _emit(f"{Colors.BLUE}ℹ {text}{Colors.ENDC}")
 
 def print_buy(text):
     """Print buy operation in green"""
-    print(f"{Colors.GREEN}BUY → {text}{Colors.ENDC}")
+    _emit(f"{Colors.GREEN}BUY → {text}{Colors.ENDC}")
 
 def print_sell(text):
     """Print sell operation in red"""
-    print(f"{Colors.RED}SELL ← {text}{Colors.ENDC}")
+    _emit(f"{Colors.RED}SELL ← {text}{Colors.ENDC}")
 
 def print_signal(text, signal_type):
     """Print signal with appropriate color"""
     if signal_type.lower() == 'buy':
-        print(f"{Colors.GREEN}SIGNAL ↑ {text}{Colors.ENDC}")
+        _emit(f"{Colors.GREEN}SIGNAL ↑ {text}{Colors.ENDC}")
     elif signal_type.lower() == 'sell':
-        print(f"{Colors.RED}SIGNAL ↓ {text}{Colors.ENDC}")
+        _emit(f"{Colors.RED}SIGNAL ↓ {text}{Colors.ENDC}")
     else:
-        print(f"{Colors.BLUE}SIGNAL - {text}{Colors.ENDC}")
+        _emit(f"{Colors.BLUE}SIGNAL - {text}{Colors.ENDC}")
 
 def print_simulation(text):
     """Print simulation message in cyan"""
-    print(f"{Colors.CYAN}SIM » {text}{Colors.ENDC}")
+    _emit(f"{Colors.CYAN}SIM » {text}{Colors.ENDC}")
 
 def print_price(price, prev_price=None):
     """Print price with color based on change"""
+    if not _INFO_ENABLED:
+        return
+    
     # Ensure price is a float
     try:
         price = float(price)
         if prev_price is not None:
             prev_price = float(prev_price)
     except (ValueError, TypeError):
-        print(f"PRICE = ${price}")
+        _emit(f"PRICE = ${price}")
         return
         
     # Rest of the function remains the same
     if prev_price is None:
-        print(f"PRICE = ${price:.2f}")
+        _emit(f"PRICE = ${price:.2f}")
     else:
         if price > prev_price:
-            print(f"{Colors.GREEN}PRICE ↑ ${price:.2f} (+{(price-prev_price):.2f}){Colors.ENDC}")
+            _emit(f"{Colors.GREEN}PRICE ↑ ${price:.2f} (+{(price-prev_price):.2f}){Colors.ENDC}")
         elif price < prev_price:
-            print(f"{Colors.RED}PRICE ↓ ${price:.2f} (-{(prev_price-price):.2f}){Colors.ENDC}")
+            _emit(f"{Colors.RED}PRICE ↓ ${price:.2f} (-{(prev_price-price):.2f}){Colors.ENDC}")
         else:
-            print(f"{Colors.BLUE}PRICE = ${price:.2f} (0.00){Colors.ENDC}")
+            _emit(f"{Colors.BLUE}PRICE = ${price:.2f} (0.00){Colors.ENDC}")
             
 def format_profit(value, include_sign=True):
     """Format profit value with color and sign"""
@@ -16,7 +16,11 @@ import plotly
 from trading.bot import CryptoTradingBot
 import config
 from trading.dashboard.dashboard_main import generate_dashboard, generate_combined_dashboard
-from utils.terminal_colors import print_success, print_error, print_warning, print_info, print_header
+from utils.json_utils import load_json_file
+from utils.terminal_colors import print_success, print_error, print_warning, print_info, print_header, set_log_level
+
+# Apply the configured verbosity
+set_log_level(config.LOG_LEVEL)
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -54,8 +58,7 @@ def load_simulation_data():
             if os.path.exists(data_file):
                 print_info(f"Loading simulation data for {symbol} from {data_file}")
                 
-                with open(data_file, 'r') as f:
-                    data = json.load(f)
+                data = load_json_file(data_file)
                 
                 # Store the data
                 simulation_data[symbol] = data